@@ -13,28 +13,62 @@ from ._common import (
     as_file,
     files,
 )
+from ._digest import digest
 from ._functional import (
+    classify_many,
     contents,
+    freeze,
     is_resource,
+    is_resource_many,
+    iter_chunks,
+    iter_lines,
+    load_cache_clear,
+    load_cache_info,
+    load_csv,
+    load_json,
+    load_toml,
     open_binary,
+    open_shared,
     open_text,
     path,
     read_binary,
+    read_binary_into,
     read_text,
 )
+from ._generation import Generation, generation
+from ._region import Region, file_region, read_into, read_range
 from .abc import ResourceReader
 
 __all__ = [
     'Package',
     'Anchor',
     'ResourceReader',
+    'Generation',
+    'Region',
     'as_file',
+    'digest',
+    'file_region',
     'files',
+    'generation',
+    'read_into',
+    'read_range',
+    'classify_many',
     'contents',
+    'freeze',
     'is_resource',
+    'is_resource_many',
+    'iter_chunks',
+    'iter_lines',
+    'load_cache_clear',
+    'load_cache_info',
+    'load_csv',
+    'load_json',
+    'load_toml',
     'open_binary',
+    'open_shared',
     'open_text',
     'path',
     'read_binary',
+    'read_binary_into',
     'read_text',
 ]
@@ -1,3 +1,4 @@
+import functools
 from contextlib import suppress
 from io import TextIOWrapper
 
@@ -49,6 +50,8 @@ class CompatibilityFiles:
         Can be read and exposes the resource reader children.
         """
 
+        __slots__ = ('_reader', '_spec')
+
         def __init__(self, spec, reader):
             self._spec = spec
             self._reader = reader
@@ -84,6 +87,8 @@ class CompatibilityFiles:
         Can be read but doesn't expose any meaningful children.
         """
 
+        __slots__ = ('_name', '_reader')
+
         def __init__(self, reader, name):
             self._reader = reader
             self._name = name
@@ -115,6 +120,8 @@ class CompatibilityFiles:
         Can't be read and doesn't expose any meaningful children.
         """
 
+        __slots__ = ('_path',)
+
         def __init__(self, *path_parts):
             if len(path_parts) < 1:
                 raise ValueError('Need at least one path part to construct a path')
@@ -141,11 +148,15 @@ class CompatibilityFiles:
     def __init__(self, spec):
         self.spec = spec
 
-    @property
+    @functools.cached_property
     def _reader(self):
         with suppress(AttributeError):
             return self.spec.loader.get_resource_reader(self.spec.name)
 
+    @functools.cached_property
+    def _memoized(self):
+        return self._reader and MemoizedReader(self._reader)
+
     def _native(self):
         """
         Return the native reader if it supports files().
@@ -157,7 +168,33 @@ class CompatibilityFiles:
         return getattr(self._reader, attr)
 
     def files(self):
-        return CompatibilityFiles.SpecPath(self.spec, self._reader)
+        return CompatibilityFiles.SpecPath(self.spec, self._memoized)
+
+
+class MemoizedReader:
+    """
+    Wrap a legacy resource reader, memoizing its listing
+    and the answers to resource checks.
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+        self._resources = {}
+
+    @functools.cached_property
+    def _contents(self):
+        return tuple(self.reader.contents())
+
+    def contents(self):
+        return iter(self._contents)
+
+    def is_resource(self, name):
+        with suppress(KeyError):
+            return self._resources[name]
+        return self._resources.setdefault(name, self.reader.is_resource(name))
+
+    def open_resource(self, resource):
+        return self.reader.open_resource(resource)
 
 
 def wrap_spec(package):
@@ -1,10 +1,12 @@
 import contextlib
+import fnmatch
 import functools
 import importlib
 import inspect
 import itertools
 import os
 import pathlib
+import posixpath
 import tempfile
 import types
 from typing import Optional, cast
@@ -143,23 +145,41 @@ def _is_present_dir(path: Traversable) -> bool:
 
 
 @functools.singledispatch
-def as_file(path):
+def as_file(path, select=None):
     """
     Given a Traversable object, return that object as a
     path on the local file system in a context manager.
+
+    For a directory, ``select`` may limit the files written to
+    those needed: a glob pattern (or several) or a predicate,
+    matched against each file's '/'-separated path relative to
+    the directory. The layout of the directory is kept. A
+    directory already on the file system is returned as is.
     """
-    return _temp_dir(path) if _is_present_dir(path) else _temp_file(path)
+    if not _is_present_dir(path):
+        return _temp_file(path)
+    return _temp_dir(path, _selector(select))
 
 
 @as_file.register(pathlib.Path)
 @contextlib.contextmanager
-def _(path):
+def _(path, select=None):
     """
     Degenerate behavior for pathlib.Path objects.
     """
     yield path
 
 
+def _selector(select):
+    """
+    Resolve ``select`` to a predicate on relative paths.
+    """
+    if select is None or callable(select):
+        return select
+    patterns = [select] if isinstance(select, str) else list(select)
+    return lambda name: any(fnmatch.fnmatchcase(name, pat) for pat in patterns)
+
+
 @contextlib.contextmanager
 def _temp_path(dir: tempfile.TemporaryDirectory):
     """
@@ -170,22 +190,49 @@ def _temp_path(dir: tempfile.TemporaryDirectory):
 
 
 @contextlib.contextmanager
-def _temp_dir(path):
+def _temp_dir(path, select=None):
     """
     Given a traversable dir, recursively replicate the whole tree
-    to the file system in a context manager.
+    (or the files in it satisfying ``select``) to the file system
+    in a context manager.
     """
     assert path.is_dir()
     with _temp_path(tempfile.TemporaryDirectory()) as temp_dir:
-        yield _write_contents(temp_dir, path)
+        yield _write_contents(temp_dir, path, select)
 
 
-def _write_contents(target, source):
+def _write_contents(target, source, select=None, relative=''):
     child = target.joinpath(source.name)
-    if source.is_dir():
+    if select is None and isinstance(source, pathlib.Path):
+        _link(source, child)
+    elif source.is_dir():
         child.mkdir()
         for item in source.iterdir():
-            _write_contents(child, item)
-    else:
-        child.write_bytes(source.read_bytes())
+            _write_contents(child, item, select, posixpath.join(relative, item.name))
+    elif select is None or select(relative):
+        if isinstance(source, pathlib.Path):
+            _link(source, child)
+        else:
+            child.write_bytes(source.read_bytes())
     return child
+
+
+def _link(source: pathlib.Path, target: pathlib.Path):
+    """
+    Make ``source``, a file or tree already on the file system,
+    available at ``target`` without copying its contents where
+    possible: symlink it, else hard link each file, else copy.
+
+    The linked tree shares the original files, so it should be
+    treated as read-only.
+    """
+    with contextlib.suppress(OSError):
+        return target.symlink_to(source.absolute(), source.is_dir())
+    if source.is_dir():
+        target.mkdir()
+        for item in source.iterdir():
+            _link(item, target / item.name)
+        return
+    with contextlib.suppress(OSError):
+        return target.hardlink_to(source)
+    target.write_bytes(source.read_bytes())
@@ -0,0 +1,101 @@
+"""
+Digests of resource contents, from the cheapest source each
+backend offers.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import pathlib
+
+from ._common import _is_present_dir
+from .abc import Traversable
+
+_CHUNK = 1 << 16
+
+
+@functools.singledispatch
+def digest(path) -> str:
+    """
+    Return a digest of the contents of a resource, or, for a
+    directory, of the names and contents of everything in it.
+
+    Digests of the same resource are equal while its contents are
+    unchanged, and differ once it changes. Digests from different
+    backends are not comparable.
+    """
+    if _is_present_dir(path):
+        return _tree_digest(path)
+    return _hash(path)
+
+
+@digest.register
+def _(path: pathlib.Path) -> str:
+    if path.is_dir():
+        return _tree_digest(path)
+    stat = path.stat()
+    key = stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+    return _file_digest(key, path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_digest(key, path):
+    """
+    Hash the file at ``path``, once for each ``key`` identifying
+    its version on disk.
+    """
+    return _hash(path)
+
+
+def _hash(path: Traversable) -> str:
+    """
+    Hash the contents of a resource in chunks.
+    """
+    import hashlib  # deferred for performance (python/cpython#109829)
+
+    hash = hashlib.sha256()
+    with path.open('rb') as strm:
+        while chunk := strm.read(_CHUNK):
+            hash.update(chunk)
+    return f'sha256:{hash.hexdigest()}'
+
+
+def _tree_digest(path: Traversable) -> str:
+    """
+    Combine the digests of everything in a directory into a Merkle
+    digest, digesting the files in parallel.
+    """
+    # deferred for performance (python/cpython#109829)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as executor:
+        return _fold(_listing(path, executor))
+
+
+def _listing(path: Traversable, executor):
+    """
+    List the tree under ``path`` as sorted (name, entry) pairs, where
+    each entry is a listing for a directory or a pending digest for a
+    file.
+    """
+    entries = (
+        (
+            child.name,
+            _listing(child, executor)
+            if child.is_dir()
+            else executor.submit(digest, child),
+        )
+        for child in path.iterdir()
+    )
+    return sorted(entries, key=operator.itemgetter(0))
+
+
+def _fold(listing) -> str:
+    import hashlib  # deferred for performance (python/cpython#109829)
+
+    hash = hashlib.sha256()
+    for name, entry in listing:
+        child = _fold(entry) if isinstance(entry, list) else entry.result()
+        hash.update(f'{name}\0{child}\n'.encode())
+    return f'tree:{hash.hexdigest()}'
@@ -0,0 +1,193 @@
+"""
+Persistent directories of files derived from resources (such as
+resources extracted from archives), shared by processes and reused
+across restarts.
+
+Enabled by setting ``IMPORTLIB_RESOURCES_CACHE`` to a directory;
+``IMPORTLIB_RESOURCES_CACHE_SIZE`` bounds the size in bytes of each
+kind of cache kept in it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pathlib
+import shutil
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_SIZE = 1 << 30
+
+
+def key(identity) -> str:
+    """
+    Name the entry for a resource, given its identity and a
+    fingerprint of its contents.
+    """
+    return hashlib.sha256(repr(identity).encode()).hexdigest()[:32]
+
+
+class Cache:
+    """
+    A directory of extracted files, one entry per key.
+
+    Entries are published by atomic rename, so readers never see
+    a partial file. Users of an entry hold a shared lock on it,
+    protecting it from eviction, which removes the least recently
+    used entries once the cache outgrows ``size``.
+    """
+
+    def __init__(self, root, size: int = DEFAULT_SIZE):
+        self.root = pathlib.Path(root)
+        self.size = size
+
+    @classmethod
+    def from_environ(cls, kind: str = 'extracted') -> Cache | None:
+        """
+        Return the cache of ``kind`` configured in the environment,
+        if any.
+        """
+        root = os.environ.get('IMPORTLIB_RESOURCES_CACHE')
+        if not root or fcntl is None:
+            return None
+        size = os.environ.get('IMPORTLIB_RESOURCES_CACHE_SIZE', DEFAULT_SIZE)
+        return cls(pathlib.Path(root, kind), int(size))
+
+    @contextlib.contextmanager
+    def extract(self, key: str, name: str, opener, mode: int = 0):
+        """
+        Yield the path to the file ``name`` in the entry for ``key``,
+        first writing it from the stream returned by ``opener()``
+        (with permission bits ``mode``) if not already present.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = self.root / key
+        published = False
+        while (pin := self._pin(entry)) is None:
+            published = self._publish(entry, name, opener, mode)
+        with pin:
+            os.utime(entry)
+            if published:
+                self.evict()
+            yield entry / name
+
+    def _pin(self, entry):
+        """
+        Return the lock file of ``entry``, locked against eviction,
+        or None if there is no such entry.
+        """
+        path = entry / '.lock'
+        try:
+            # returned to the caller, which holds it while in use
+            lock = open(path, 'rb')  # noqa: SIM115
+        except FileNotFoundError:
+            return None
+        fcntl.flock(lock, fcntl.LOCK_SH)
+        with contextlib.suppress(FileNotFoundError):
+            if os.stat(path).st_ino == os.fstat(lock.fileno()).st_ino:
+                return lock
+        # evicted while waiting for the lock
+        lock.close()
+        return None
+
+    def _publish(self, entry, name, opener, mode) -> bool:
+        """
+        Write ``entry`` unless another process is doing the same,
+        returning True if this process published it.
+        """
+        with self._locked(entry.with_name(f'.{entry.name}.lock')):
+            if (entry / '.lock').exists():
+                return False
+            if entry.exists():
+                # broken, such as by a cleaner of temporary files
+                self._discard(entry)
+            staging = pathlib.Path(tempfile.mkdtemp(prefix='.tmp-', dir=self.root))
+            try:
+                (staging / '.lock').touch()
+                with opener() as source, open(staging / name, 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                if mode:
+                    os.chmod(staging / name, mode)
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+            try:
+                staging.rename(entry)
+            except OSError:
+                # published concurrently
+                shutil.rmtree(staging)
+                return False
+            return True
+
+    @contextlib.contextmanager
+    def _locked(self, path):
+        with open(path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def evict(self):
+        """
+        Remove the least recently used entries not in use until the
+        cache fits within its size.
+        """
+        with open(self.root / '.lock', 'a') as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # another process is evicting
+                return
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in entries:
+                if total <= self.size:
+                    break
+                if self._remove(entry):
+                    total -= size
+
+    def _entries(self):
+        """
+        Generate (last used, size, path) for each entry.
+        """
+        for entry in self.root.iterdir():
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                size = sum(item.stat().st_size for item in entry.iterdir())
+                yield entry.stat().st_mtime_ns, size, entry
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove the entry for ``key`` unless it is in use.
+        """
+        return self._remove(self.root / key)
+
+    def _remove(self, entry) -> bool:
+        """
+        Remove ``entry`` unless it is in use.
+        """
+        try:
+            with open(entry / '.lock', 'rb') as lock:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return False
+                self._discard(entry)
+        except FileNotFoundError:
+            return False
+        with contextlib.suppress(FileNotFoundError):
+            entry.with_name(f'.{entry.name}.lock').unlink()
+        return True
+
+    def _discard(self, entry):
+        """
+        Move ``entry`` out of the way at once, then delete it.
+        """
+        trash = pathlib.Path(tempfile.mkdtemp(prefix='.trash-', dir=self.root))
+        entry.rename(trash / entry.name)
+        shutil.rmtree(trash, ignore_errors=True)
@@ -1,12 +1,21 @@
 """Simplified function-based API for importlib.resources"""
 
+import contextlib
+import io
+import itertools
+import mmap
+import os
+import pathlib
 import warnings
 
-from ._common import as_file, files
+from . import _region
+from ._common import as_file, files, resolve
 from .abc import TraversalError
 
 _MISSING = object()
 
+_frozen: dict = {}
+
 
 def open_binary(anchor, *path_names):
     """Open for binary reading the *resource* within *package*."""
@@ -25,6 +34,14 @@ def read_binary(anchor, *path_names):
     return _get_resource(anchor, path_names).read_bytes()
 
 
+def read_binary_into(anchor, *path_names, buffer):
+    """Read contents of *resource* within *package* into *buffer*,
+    reusing it rather than allocating bytes, and return the number
+    of bytes read.
+    """
+    return _region.read_into(_get_resource(anchor, path_names), buffer)
+
+
 def read_text(anchor, *path_names, encoding=_MISSING, errors='strict'):
     """Read and return contents of *resource* within *package* as str."""
     encoding = _get_encoding_arg(path_names, encoding)
@@ -32,11 +49,117 @@ def read_text(anchor, *path_names, encoding=_MISSING, errors='strict'):
     return resource.read_text(encoding=encoding, errors=errors)
 
 
+def iter_chunks(anchor, *path_names, size=1 << 20):
+    """Iterate over the contents of *resource* within *package* in
+    chunks of up to *size* bytes, holding no more than one in memory.
+    """
+    return _iter_chunks(_get_resource(anchor, path_names), size)
+
+
+def iter_lines(anchor, *path_names, encoding=_MISSING, errors='strict'):
+    """Iterate over the lines of *resource* within *package* as str,
+    decoding incrementally and holding only part of it in memory.
+    """
+    encoding = _get_encoding_arg(path_names, encoding)
+    return _iter_lines(_get_resource(anchor, path_names), encoding, errors)
+
+
+def freeze(anchor, *path_names):
+    """Load *resource* within *package* into memory shared with forked
+    child processes and return a read-only :class:`memoryview` of it.
+
+    Call in a parent process before forking workers. Later calls,
+    including those in the children, return the same view, whose
+    pages remain shared rather than copied on write.
+    """
+    resource = _get_resource(anchor, path_names)
+    key = resolve(anchor).__name__, path_names
+    with contextlib.suppress(KeyError):
+        return _frozen[key]
+    data = resource.read_bytes()
+    shared = mmap.mmap(-1, len(data) or 1)
+    shared.write(data)
+    return _frozen.setdefault(key, memoryview(shared)[: len(data)].toreadonly())
+
+
+def open_shared(anchor, *path_names):
+    """Attach to the contents of *resource* within *package* in memory
+    shared across processes, publishing them if no process has yet.
+
+    Return a :class:`SharedResource` whose ``view`` is a read-only
+    :class:`memoryview` of the contents. Close it (or use it as a
+    context manager) to detach; the last process to detach frees
+    the memory.
+    """
+    # deferred for performance (python/cpython#109829)
+    from ._shared import SharedResource
+
+    resource = _get_resource(anchor, path_names)
+    return SharedResource((resolve(anchor).__name__, path_names), resource)
+
+
 def path(anchor, *path_names):
     """Return the path to the *resource* as an actual file system path."""
     return as_file(_get_resource(anchor, path_names))
 
 
+def load_json(anchor, *path_names):
+    """Parse *resource* within *package* as JSON.
+
+    The result is memoized until the resource changes and is frozen:
+    objects are read-only mappings and arrays are tuples.
+    """
+    # deferred for performance (python/cpython#109829)
+    from ._loaders import memo, parse_json
+
+    return memo.load(anchor, path_names, parse_json)
+
+
+def load_toml(anchor, *path_names):
+    """Parse *resource* within *package* as TOML (with ``tomli`` before
+    Python 3.11).
+
+    The result is memoized until the resource changes and is frozen:
+    tables are read-only mappings and arrays are tuples.
+    """
+    # deferred for performance (python/cpython#109829)
+    from ._loaders import memo, parse_toml
+
+    return memo.load(anchor, path_names, parse_toml)
+
+
+def load_csv(anchor, *path_names, encoding='utf-8', dialect='excel', **fmtparams):
+    """Parse *resource* within *package* as CSV, returning a tuple of
+    rows, each a tuple of str.
+
+    The result is memoized until the resource changes.
+    """
+    # deferred for performance (python/cpython#109829)
+    from ._loaders import memo, parse_csv
+
+    options = dict(encoding=encoding, dialect=dialect, **fmtparams)
+    return memo.load(anchor, path_names, parse_csv, **options)
+
+
+def load_cache_info():
+    """Report the hits, misses, number of entries and approximate
+    memory in bytes of the results memoized by the ``load_*``
+    functions.
+    """
+    # deferred for performance (python/cpython#109829)
+    from ._loaders import memo
+
+    return memo.info()
+
+
+def load_cache_clear():
+    """Discard the results memoized by the ``load_*`` functions."""
+    # deferred for performance (python/cpython#109829)
+    from ._loaders import memo
+
+    memo.clear()
+
+
 def is_resource(anchor, *path_names):
     """Return ``True`` if there is a resource named *name* in the package,
 
@@ -48,6 +171,29 @@ def is_resource(anchor, *path_names):
         return False
 
 
+def is_resource_many(anchor, names):
+    """Return a dict of whether each of *names* is a resource in the
+    package, as :func:`is_resource` would, but resolving the package
+    once and listing each directory at most once.
+
+    Each name is a ``/``-separated path or a tuple of path names.
+    """
+    kinds = classify_many(anchor, names)
+    return {name: kind == 'file' for name, kind in kinds.items()}
+
+
+def classify_many(anchor, names):
+    """Return a dict classifying each of *names* within the package
+    as ``'file'``, ``'dir'`` or ``'missing'``, resolving the package
+    once and listing each directory at most once.
+
+    Each name is a ``/``-separated path or a tuple of path names.
+    """
+    root = _get_resource(anchor, ())
+    listings: dict = {}
+    return {name: _classify(root, _parts(name), listings) for name in names}
+
+
 def contents(anchor, *path_names):
     """Return an iterable over the named resources within the package.
 
@@ -82,3 +228,57 @@ def _get_resource(anchor, path_names):
     if anchor is None:
         raise TypeError("anchor must be module or string, got None")
     return files(anchor).joinpath(*path_names)
+
+
+def _parts(name):
+    path_names = (name,) if isinstance(name, str) else name
+    return tuple(
+        itertools.chain.from_iterable(
+            pathlib.PurePosixPath(path_name).parts for path_name in path_names
+        )
+    )
+
+
+def _classify(root, parts, listings):
+    if not parts:
+        return 'dir'
+    return _listing(root, parts[:-1], listings).get(parts[-1], 'missing')
+
+
+def _listing(root, parts, listings):
+    """Return the kind of each entry in the directory at *parts*,
+    empty if there is no such directory.
+    """
+    with contextlib.suppress(KeyError):
+        return listings[parts]
+    if parts and _classify(root, parts, listings) != 'dir':
+        listing = {}
+    else:
+        listing = _kinds(root.joinpath(*parts))
+    return listings.setdefault(parts, listing)
+
+
+def _kinds(directory):
+    if isinstance(directory, pathlib.Path):
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: 'dir' if entry.is_dir() else 'file'
+                for entry in entries
+                if entry.is_dir() or entry.is_file()
+            }
+    return {
+        child.name: 'dir' if child.is_dir() else 'file' for child in directory.iterdir()
+    }
+
+
+def _iter_chunks(resource, size):
+    with resource.open('rb') as strm:
+        while chunk := strm.read(size):
+            yield chunk
+
+
+def _iter_lines(resource, encoding, errors):
+    with resource.open('rb') as strm:
+        # read in large chunks
+        lines = io.TextIOWrapper(io.BufferedReader(strm, 1 << 20), encoding, errors)
+        yield from lines
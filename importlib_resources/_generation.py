@@ -0,0 +1,118 @@
+"""
+Cheap detection of changes to trees of resources.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import pathlib
+import posixpath
+import time
+
+from ._digest import digest
+
+RACY_NS = 2 * 10**9
+"""
+Directories modified this recently may change again without
+their modification time changing, so their listings are not kept.
+"""
+
+
+class Generation:
+    """
+    A snapshot of the state of each resource in a tree, keyed by
+    its '/'-separated path relative to the root of the tree.
+
+    States are compared, never read: they are cheap stand-ins for
+    the contents, such as file metadata or a digest. ``basis`` holds
+    whatever the backend needs to take the next generation of the
+    same tree cheaply.
+    """
+
+    def __init__(self, entries: dict, basis=None):
+        self.entries = entries
+        self.basis = basis
+
+    def __eq__(self, other):
+        if not isinstance(other, Generation):
+            return NotImplemented
+        return self.entries == other.entries
+
+    def __hash__(self):
+        return hash(frozenset(self.entries.items()))
+
+    def changed_since(self, previous: Generation) -> set[str]:
+        """
+        Return the names of resources added, removed or altered
+        since the ``previous`` generation.
+        """
+        names = self.entries.keys() | previous.entries.keys()
+        return {
+            name
+            for name in names
+            if self.entries.get(name) != previous.entries.get(name)
+        }
+
+
+@functools.singledispatch
+def generation(path, previous: Generation | None = None) -> Generation:
+    """
+    Take a :class:`Generation` of the tree under ``path``.
+
+    Pass the ``previous`` generation of the same tree, if any, to
+    allow parts of the tree known not to have changed to be
+    skipped.
+    """
+    return Generation(dict(_walk_digests(path)))
+
+
+def _walk_digests(path, prefix=''):
+    for child in path.iterdir():
+        name = prefix + child.name
+        if child.is_dir():
+            yield from _walk_digests(child, name + '/')
+        else:
+            yield name, digest(child)
+
+
+@generation.register
+def _(path: pathlib.Path, previous: Generation | None = None) -> Generation:
+    """
+    Snapshot file metadata, listing only those directories whose
+    modification time has changed since the ``previous`` generation.
+
+    File contents altered in place are detected by their metadata,
+    which is still read for every file. Listings of directories
+    modified within ``RACY_NS`` of the snapshot are not kept.
+    """
+    known = previous.basis if previous is not None else {}
+    now = time.time_ns()
+    entries = {}
+    listings = {}
+    pending = ['']
+    while pending:
+        relative = pending.pop()
+        directory = os.path.join(path, relative)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        listing = known.get(relative)
+        if listing is None or listing[0] != mtime:
+            with os.scandir(directory) as children:
+                names = tuple((child.name, child.is_dir()) for child in children)
+            listing = mtime, names
+        if now - mtime > RACY_NS:
+            listings[relative] = listing
+        for name, is_dir in listing[1]:
+            child = posixpath.join(relative, name)
+            if is_dir:
+                pending.append(child)
+                continue
+            try:
+                stat = os.stat(os.path.join(path, child))
+            except FileNotFoundError:
+                continue
+            entries[child] = stat.st_mtime_ns, stat.st_size, stat.st_ino
+    return Generation(entries, listings)
@@ -0,0 +1,189 @@
+"""
+Parsed forms of data resources, memoized until the resources change.
+
+With the cache of ``_extract`` enabled, parsed forms are also
+compiled to disk, much as modules are to ``.pyc`` files, so that
+other processes load them instead of parsing the resources again.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import io
+import json
+import marshal
+import sys
+import types
+from typing import NamedTuple
+
+from . import _extract
+from ._common import resolve
+from ._digest import digest
+from ._functional import _get_resource
+
+FORMAT = 1
+"""
+Version of the compiled forms; bump when a parser's output changes.
+"""
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+    nbytes: int
+
+
+class Memo:
+    """
+    Parsed resources, keyed by resource, parser and options, each
+    held until the digest of its resource changes.
+
+    The digest is checked on every load. Files on disk are hashed
+    only when their metadata changes and zip members are digested
+    from the archive's directory, but resources of other readers
+    are hashed in full each time.
+
+    Results are frozen (dicts as read-only mappings, lists as
+    tuples), so they may be shared safely by every caller.
+    """
+
+    def __init__(self):
+        self._entries: dict = {}
+        self.hits = self.misses = 0
+
+    def load(self, anchor, path_names, parse, **options):
+        resource = _get_resource(anchor, path_names)
+        key = resolve(anchor).__name__, path_names, parse, tuple(options.items())
+        fresh = digest(resource)
+        with contextlib.suppress(KeyError):
+            entry_fresh, value, _ = self._entries[key]
+            if entry_fresh == fresh:
+                self.hits += 1
+                return value
+        self.misses += 1
+        value, size = _compiled(resource, key[:2] + (fresh,), parse, options)
+        self._entries[key] = fresh, _freeze(value), size
+        return self._entries[key][1]
+
+    def info(self) -> CacheInfo:
+        entries = list(self._entries.values())
+        nbytes = sum(size for _, _, size in entries)
+        return CacheInfo(self.hits, self.misses, len(entries), nbytes)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+def _compiled(resource, identity, parse, options: dict):
+    """
+    Parse ``resource``, returning the parsed form and its size,
+    loaded from the form compiled by an earlier parse of the same
+    contents if the cache has it, and compiled there if not.
+
+    A failure of the cache falls back to parsing the resource, as
+    does any failure to load a compiled form, which is then removed
+    so that it is compiled again. Errors in parsing propagate.
+    """
+    cache = _extract.Cache.from_environ('parsed')
+    if cache is None:
+        return _parsed(resource, parse, options)
+    parser = parse.__module__, parse.__qualname__, sorted(options.items())
+    versions = FORMAT, sys.version_info[:2]
+    entry = _extract.key((identity, parser, versions))
+    parsed = []
+
+    def produce():
+        parsed.append(_parsed(resource, parse, options))
+        return io.BytesIO(_dump(parsed[0]))
+
+    try:
+        with cache.extract(entry, 'parsed', produce) as path:
+            if parsed:
+                return parsed[0]
+            data = path.read_bytes()
+    except OSError:
+        return parsed[0] if parsed else _parsed(resource, parse, options)
+    try:
+        return _load(data)
+    except Exception:  # noqa: BLE001 corrupt pickles raise almost any error
+        with contextlib.suppress(OSError):
+            cache.remove(entry)
+        return _parsed(resource, parse, options)
+
+
+def _parsed(resource, parse, options: dict):
+    value = parse(resource.read_bytes(), **options)
+    return value, _sizeof(value)
+
+
+def _dump(parsed) -> bytes:
+    """
+    Compile a parsed value and its size with ``marshal`` where it
+    can, falling back to ``pickle`` for other types (such as TOML
+    dates).
+    """
+    try:
+        return b'M' + marshal.dumps(parsed)
+    except ValueError:
+        import pickle  # deferred for performance (python/cpython#109829)
+
+        return b'P' + pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+
+
+def _load(data: bytes):
+    if data[:1] == b'M':
+        value, size = marshal.loads(data[1:])
+        return value, size
+    import pickle  # deferred for performance (python/cpython#109829)
+
+    value, size = pickle.loads(data[1:])
+    return value, size
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return types.MappingProxyType({
+            key: _freeze(item) for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(map(_freeze, value))
+    return value
+
+
+def _sizeof(value) -> int:
+    """
+    Approximate the memory occupied by a parsed value.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_sizeof(key) + _sizeof(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(map(_sizeof, value))
+    return size
+
+
+def parse_json(data: bytes):
+    return json.loads(data)
+
+
+def parse_toml(data: bytes):
+    try:
+        from .compat.py310 import tomllib
+    except ImportError as exc:
+        raise ImportError(
+            "load_toml() requires tomli before Python 3.11; "
+            "install importlib_resources[toml]"
+        ) from exc
+
+    return tomllib.loads(data.decode('utf-8'))
+
+
+def parse_csv(data: bytes, encoding='utf-8', dialect='excel', **fmtparams):
+    text = io.StringIO(data.decode(encoding), newline='')
+    return list(map(tuple, csv.reader(text, dialect, **fmtparams)))
+
+
+memo = Memo()
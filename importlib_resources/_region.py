@@ -0,0 +1,129 @@
+"""
+Direct access to the bytes of resources held in files.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import pathlib
+
+_CHUNK = 1 << 16
+
+
+class Region:
+    """
+    An open file descriptor and the range of bytes in it holding
+    a resource, suitable for ``os.sendfile`` or ``os.pread``.
+
+    The descriptor is owned by the region; use the region as a
+    context manager or call :meth:`close` to release it.
+    """
+
+    def __init__(self, fd: int, offset: int, length: int):
+        self.fd = fd
+        self.offset = offset
+        self.length = length
+
+    @classmethod
+    def of_file(cls, path) -> Region:
+        """
+        Open the whole of the file at ``path``.
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        return cls(fd, 0, os.fstat(fd).st_size)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.fd}, {self.offset}, {self.length})'
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@functools.singledispatch
+def file_region(path) -> Region | None:
+    """
+    Return a :class:`Region` of a file holding the contents of the
+    resource at ``path`` unaltered, or None if there is no such
+    region and the resource must be streamed through ``open()``.
+    """
+    return None
+
+
+@file_region.register
+def _(path: pathlib.Path) -> Region | None:
+    if path.is_dir():
+        return None
+    return Region.of_file(path)
+
+
+@functools.singledispatch
+def read_range(path, offset: int, length: int) -> bytes:
+    """
+    Read up to ``length`` bytes of the resource at ``path``, starting
+    at ``offset``, without reading what precedes it where the
+    backend allows.
+    """
+    _check_range(offset, length)
+    with path.open('rb') as strm:
+        if strm.seekable():
+            strm.seek(offset)
+        else:
+            while offset and (skipped := strm.read(min(offset, _CHUNK))):
+                offset -= len(skipped)
+        return strm.read(length)
+
+
+@read_range.register
+def _(path: pathlib.Path, offset: int, length: int) -> bytes:
+    if not hasattr(os, 'pread'):
+        return read_range.dispatch(object)(path, offset, length)
+    _check_range(offset, length)
+    with Region.of_file(path) as region:
+        return os.pread(region.fd, length, offset)
+
+
+@functools.singledispatch
+def read_into(path, buffer) -> int:
+    """
+    Read the whole of the resource at ``path`` into ``buffer`` (any
+    writable, contiguous buffer), returning the number of bytes read,
+    without allocating a copy of the contents where the backend
+    allows.
+
+    Raise ValueError if the resource does not fit in ``buffer``.
+    """
+    with path.open('rb') as strm:
+        return fill(strm, buffer)
+
+
+@read_into.register
+def _(path: pathlib.Path, buffer) -> int:
+    with open(path, 'rb', buffering=0) as strm:
+        return fill(strm, buffer)
+
+
+def fill(strm, buffer) -> int:
+    """
+    Read ``strm`` to its end into ``buffer`` using ``readinto``.
+    """
+    view = memoryview(buffer).cast('B')
+    filled = 0
+    while filled < len(view) and (count := strm.readinto(view[filled:])):
+        filled += count
+    if filled == len(view) and strm.read(1):
+        raise ValueError(f"Resource does not fit in {len(view)} bytes")
+    return filled
+
+
+def _check_range(offset, length):
+    if offset < 0 or length < 0:
+        raise ValueError(f"Invalid range ({offset!r}, {length!r})")
@@ -0,0 +1,226 @@
+"""
+Share the contents of resources across processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import os
+import pathlib
+import struct
+import tempfile
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+
+from ._digest import digest
+from .abc import Traversable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+_header = struct.Struct('<Q')
+"""
+Length of the contents.
+"""
+
+
+def segment_name(identity, resource: Traversable) -> str:
+    """
+    Name the shared memory segment for a resource, distinct for
+    each identity and each version of its contents.
+    """
+    key = repr((_owner(), identity, fingerprint(resource))).encode()
+    return 'ir_' + hashlib.sha256(key).hexdigest()[:24]
+
+
+@functools.singledispatch
+def fingerprint(resource):
+    """
+    Identify the version of the contents of a resource, as cheaply
+    as the backend allows.
+    """
+    return digest(resource)
+
+
+@fingerprint.register
+def _(resource: pathlib.Path):
+    """
+    Identify files by their metadata, rather than having every
+    process hash the whole file before it may attach.
+    """
+    stat = resource.stat()
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class SharedResource:
+    """
+    The contents of a resource, published once in shared memory
+    and attached to by any number of processes.
+
+    ``view`` is a read-only :class:`memoryview` of the contents.
+    Release any views derived from it before calling :meth:`close`.
+    On POSIX, the segment is removed when the last user detaches,
+    whether by :meth:`close` or by the handle being collected.
+
+    Each user holds a shared lock on a file named for the segment,
+    which the system releases should the user die without detaching.
+    A segment whose users all died is removed when another process
+    next publishes a segment.
+    """
+
+    def __init__(self, identity, resource: Traversable):
+        self.name = segment_name(identity, resource)
+        with _lock():
+            try:
+                self._memory = _attach(self.name)
+            except FileNotFoundError:
+                _sweep()
+                self._memory = _publish(self.name, resource.read_bytes())
+            user = _join(self.name)
+        (size,) = _header.unpack_from(self._memory.buf)
+        self.view = self._memory.buf[_header.size : _header.size + size].toreadonly()
+        self._detach = weakref.finalize(self, _detach, self._memory, user)
+
+    def close(self):
+        if self.view is None:
+            return
+        self.view.release()
+        self.view = None
+        self._detach()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _detach(memory, user):
+    with _lock():
+        try:
+            memory.close()
+        except BufferError:
+            # Views of the contents outlive the handle; the mapping
+            # is removed along with the last of them.
+            memory._mmap = None
+        if user is not None:
+            os.close(user)
+            _remove_unused(memory.name)
+
+
+def _join(name) -> int | None:
+    """
+    Return a descriptor holding a shared lock on the users file of
+    segment ``name`` for as long as it is open.
+    """
+    if fcntl is None:  # pragma: no cover
+        return None
+    user = os.open(os.path.join(_users(), name), os.O_RDONLY | os.O_CREAT, 0o600)
+    fcntl.flock(user, fcntl.LOCK_SH)
+    return user
+
+
+def _remove_unused(name):
+    """
+    Remove segment ``name`` and its users file if no process holds
+    a lock on that file.
+    """
+    path = os.path.join(_users(), name)
+    try:
+        probe = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+    try:
+        fcntl.flock(probe, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            memory = _attach(name)
+            memory.close()
+            _unlink(memory)
+        os.unlink(path)
+    finally:
+        os.close(probe)
+
+
+def _sweep():
+    """
+    Remove the segments of users that died without detaching.
+    """
+    if fcntl is None:  # pragma: no cover
+        return
+    for name in os.listdir(_users()):
+        _remove_unused(name)
+
+
+def _attach(name):
+    memory = shared_memory.SharedMemory(name)
+    _untrack(memory)
+    return memory
+
+
+def _publish(name, data):
+    memory = shared_memory.SharedMemory(
+        name, create=True, size=_header.size + len(data)
+    )
+    _untrack(memory)
+    _header.pack_into(memory.buf, 0, len(data))
+    memory.buf[_header.size : _header.size + len(data)] = data
+    return memory
+
+
+def _untrack(memory):
+    """
+    Segments outlive the process that created them and are removed
+    by the last user to detach, so keep the resource tracker from
+    removing them at exit.
+    """
+    if os.name == 'posix':
+        resource_tracker.unregister(memory._name, 'shared_memory')
+
+
+def _unlink(memory):
+    # unlink() also unregisters from the resource tracker
+    resource_tracker.register(memory._name, 'shared_memory')
+    memory.unlink()
+
+
+@contextlib.contextmanager
+def _lock():
+    """
+    Serialize publication and reference counting across processes.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    name = f'importlib_resources-shared-{_owner()}.lock'
+    path = os.path.join(tempfile.gettempdir(), name)
+    with open(path, 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _users():
+    """
+    The directory of users files, one per segment.
+    """
+    name = f'importlib_resources-shared-{_owner()}'
+    path = os.path.join(tempfile.gettempdir(), name)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def _owner():
+    """
+    The user owning segments and the lock, kept apart from those
+    of other users.
+    """
+    return os.getuid() if hasattr(os, 'getuid') else ''
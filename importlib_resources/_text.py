@@ -0,0 +1,36 @@
+"""
+Decoding of resource contents to text.
+"""
+
+from __future__ import annotations
+
+import io
+import locale
+import sys
+
+
+def decode(data: bytes, encoding: str | None = None, errors: str | None = None):
+    """
+    Decode the whole of ``data`` in one step, with the result
+    ``io.TextIOWrapper`` would give reading it in universal
+    newlines mode.
+    """
+    text = data.decode(_resolve(encoding), errors or 'strict')
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _resolve(encoding):
+    """
+    Resolve the encoding as ``io.TextIOWrapper`` does, including the
+    default to the locale encoding (or UTF-8 in UTF-8 mode).
+    """
+    encoding = io.text_encoding(encoding, 3)
+    if encoding != 'locale':
+        return encoding
+    if sys.flags.utf8_mode:
+        return 'utf-8'
+    if sys.version_info >= (3, 11):
+        return locale.getencoding()
+    return locale.getpreferredencoding(False)  # pragma: no cover
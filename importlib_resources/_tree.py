@@ -0,0 +1,138 @@
+"""
+A compact index of the names in a tree of resources.
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+from array import array
+from collections.abc import Iterable
+
+DIRECTORY = -1
+"""
+The size recorded for a directory.
+"""
+
+
+class Tree:
+    """
+    The names and sizes of the entries in a tree of resources, held
+    in a few flat arrays rather than an object per entry.
+
+    Nodes are numbered breadth first from the root (node 0), the
+    children of each directory numbered consecutively in order of
+    name, so that the children of a directory are a range of nodes.
+    The names of all nodes are slices of a single string, and each
+    node is found from its parent and name through an open-addressed
+    hash table of node numbers.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, int]]):
+        """
+        Index ``entries`` of (name, size), where directories are
+        named with a trailing slash and implied by the names of
+        their descendants.
+        """
+        listings = _listings(entries)
+        names = ['']
+        self.sizes = array('q', [DIRECTORY])
+        self.parents = array('i', [-1])
+        self.firsts = array('I')
+        # paths of the directories numbered but not yet listed
+        pending = collections.deque([''])
+        node = 0
+        while node < len(self.sizes):
+            self.firsts.append(len(self.sizes))
+            if self.sizes[node] == DIRECTORY:
+                path = pending.popleft()
+                for name, size in sorted(listings.pop(path).items()):
+                    if size == DIRECTORY:
+                        pending.append(f'{path}/{name}' if path else name)
+                    names.append(name)
+                    self.sizes.append(size)
+                    self.parents.append(node)
+            node += 1
+        self.firsts.append(len(self.sizes))
+        self.ends = array('I', itertools.accumulate(map(len, names)))
+        self.names = ''.join(names)
+        self._slots = array('i', [-1]) * (1 << (2 * len(names)).bit_length())
+        mask = len(self._slots) - 1
+        for node, name in enumerate(names[1:], 1):
+            slot = hash((self.parents[node], name)) & mask
+            while self._slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            self._slots[slot] = node
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def name(self, node: int) -> str:
+        start = self.ends[node - 1] if node else 0
+        return self.names[start : self.ends[node]]
+
+    def is_dir(self, node: int) -> bool:
+        return self.sizes[node] == DIRECTORY
+
+    def children(self, node: int) -> range:
+        return range(self.firsts[node], self.firsts[node + 1])
+
+    def path(self, node: int) -> str:
+        """
+        Return the name of ``node`` relative to the root, with a
+        trailing slash for a directory.
+        """
+        suffix = '/' if node and self.is_dir(node) else ''
+        parts = []
+        while node > 0:
+            parts.append(self.name(node))
+            node = self.parents[node]
+        return '/'.join(reversed(parts)) + suffix
+
+    def find(self, path: str) -> int:
+        """
+        Return the node at the '/'-separated ``path``, or -1 if there
+        is no such node.
+        """
+        node = 0
+        for part in filter(None, path.split('/')):
+            node = self.child(node, part)
+            if node < 0:
+                break
+        return node
+
+    def child(self, node: int, name: str) -> int:
+        """
+        Return the child of ``node`` named ``name``, or -1 if there
+        is no such child.
+        """
+        mask = len(self._slots) - 1
+        slot = hash((node, name)) & mask
+        while (child := self._slots[slot]) >= 0:
+            if self.parents[child] == node and self.name(child) == name:
+                return child
+            slot = (slot + 1) & mask
+        return -1
+
+
+def _listings(entries) -> dict[str, dict[str, int]]:
+    """
+    Map each directory (by its path without a trailing slash) to
+    the size of each of its children by name, adding directories
+    implied by the names of their descendants.
+    """
+    listings: dict[str, dict[str, int]] = {'': {}}
+    for name, size in entries:
+        path = name.rstrip('/')
+        if name.endswith('/'):
+            size = DIRECTORY
+        while path:
+            parent, _, base = path.rpartition('/')
+            siblings = listings.setdefault(parent, {})
+            if base in siblings:
+                break
+            siblings[base] = size
+            if size == DIRECTORY:
+                listings.setdefault(path, {})
+            path, size = parent, DIRECTORY
+    return listings
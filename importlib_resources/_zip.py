@@ -0,0 +1,713 @@
+"""
+Low-level support for reading members of zip archives.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import functools
+import io
+import os
+import posixpath
+import re
+import struct
+import threading
+import weakref
+import zipfile
+import zlib
+
+from . import _extract, _generation, _region, _text
+from ._common import as_file
+from ._digest import digest
+from .compat.py39 import ZipPath
+
+CHECKPOINT_INTERVAL = 1 << 20
+"""
+Distance, in uncompressed bytes, between recorded inflate states.
+"""
+
+CHECKPOINTED_MEMBERS = 8
+"""
+Number of members of each archive whose inflate states are kept.
+"""
+
+_CHUNK = 1 << 16
+
+_local_header = struct.Struct('<4s2B4HL2L2H')
+_local_header_magic = b'PK\003\004'
+
+
+class Archive:
+    """
+    A zip file opened once and read by offset, so that any number
+    of threads may read its members concurrently.
+
+    Where ``os.pread`` is available, all threads share the one
+    descriptor, and ``zipfile`` reads through a ``PositionalFile``
+    so that no read depends on the descriptor's offset, which
+    processes forked from this one share. Elsewhere, each thread
+    opens its own handle.
+    """
+
+    def __init__(self, path, source=None):
+        self.path = os.fspath(path)
+        self._handles: list = []
+        if source is None and hasattr(os, 'pread'):
+            source = PositionalFile(self.path)
+            self._handles.append(source)
+        self.zipfile = zipfile.ZipFile(self.path if source is None else source)
+        self._offsets: dict[str, int] = {}
+        self._checkpoints: dict[tuple[str, int], Checkpoints] = {}
+        self._checkpoints_lock = threading.Lock()
+        self._nested: dict[str, NestedArchive] = {}
+        self._local = threading.local()
+        weakref.finalize(self, _close, self.zipfile, self._handles)
+
+    @classmethod
+    def for_path(cls, path):
+        """
+        Return the Archive for the file at ``path``, shared for as
+        long as any reference to it remains and reopened if the file
+        has changed.
+
+        ``path`` may continue past the file into archives nested in
+        it, as in ``app.pyz/plugins/inner.zip``.
+        """
+        file, members = _split_file(os.fspath(path))
+        stat = os.stat(file)
+        key = file, stat.st_ino, stat.st_size, stat.st_mtime_ns
+        try:
+            archive = _archives[key]
+        except KeyError:
+            with _archives_lock:
+                archive = _archives.get(key) or _archives.setdefault(key, cls(file))
+        return archive._descend(members) if members else archive
+
+    def _descend(self, members: str) -> Archive:
+        """
+        Return the archive nested in this one at ``members``, the
+        '/'-separated names of each nested archive in turn.
+        """
+        archive, name = self, ''
+        for part in members.strip('/').split('/'):
+            name = posixpath.join(name, part)
+            if name in archive.index.files:
+                archive, name = archive.nested(name), ''
+        if name:
+            raise FileNotFoundError(posixpath.join(archive.path, name))
+        return archive
+
+    def nested(self, name: str) -> NestedArchive:
+        """
+        Return the archive held in the member ``name``, opened once
+        and shared for as long as this archive.
+        """
+        with contextlib.suppress(KeyError):
+            return self._nested[name]
+        archive = NestedArchive(self, self.zipfile.getinfo(name))
+        return self._nested.setdefault(name, archive)
+
+    def read(self, offset: int, size: int) -> bytes:
+        """
+        Read up to ``size`` bytes at ``offset`` in the archive.
+        """
+        if hasattr(os, 'pread'):
+            return os.pread(self.zipfile.fp.fileno(), size, offset)
+        handle = self._handle()
+        handle.seek(offset)
+        return handle.read(size)
+
+    def locate(self, offset: int) -> tuple[int, int] | None:
+        """
+        Return the descriptor of the file on disk holding the byte at
+        ``offset`` in the archive and its offset in that file, or None
+        if the archive is not held unaltered in a file.
+        """
+        return self.zipfile.fp.fileno(), offset
+
+    def _handle(self):
+        try:
+            return self._local.handle
+        except AttributeError:
+            # closed with the archive, outliving this call
+            self._local.handle = handle = open(self.path, 'rb')  # noqa: SIM115
+            self._handles.append(handle)
+            return handle
+
+    def data_offset(self, info: zipfile.ZipInfo) -> int:
+        """
+        Return the offset of the (possibly compressed) data for the
+        member described by ``info``.
+        """
+        with contextlib.suppress(KeyError):
+            return self._offsets[info.filename]
+        header = _local_header.unpack(self.read(info.header_offset, _local_header.size))
+        if header[0] != _local_header_magic:
+            raise zipfile.BadZipFile(
+                f"Bad magic number for file header: {info.filename}"
+            )
+        name_length, extra_length = header[-2:]
+        offset = info.header_offset + _local_header.size + name_length + extra_length
+        return self._offsets.setdefault(info.filename, offset)
+
+    @functools.cached_property
+    def index(self) -> Index:
+        """
+        The names in the archive, built once and shared by all paths.
+        """
+        return Index(self.zipfile.namelist())
+
+    def checkpoints(self, info: zipfile.ZipInfo, interval: int) -> Checkpoints:
+        """
+        Return the inflate checkpoints shared by streams of a member.
+
+        Checkpoints are kept for the ``CHECKPOINTED_MEMBERS`` members
+        whose checkpoints were most recently created, bounding the
+        inflate states retained. Finding existing checkpoints takes
+        no lock.
+        """
+        key = info.filename, interval
+        with contextlib.suppress(KeyError):
+            return self._checkpoints[key]
+        with self._checkpoints_lock:
+            checkpoints = self._checkpoints.get(key)
+            if checkpoints is None:
+                checkpoints = self._checkpoints[key] = Checkpoints(interval)
+                while len(self._checkpoints) > CHECKPOINTED_MEMBERS:
+                    del self._checkpoints[next(iter(self._checkpoints))]
+            return checkpoints
+
+    def _after_fork(self):
+        """
+        Give this process fresh locks, rather than inheriting locks
+        that may have been held at the fork.
+
+        The inherited descriptor is kept: it refers to the file whose
+        central directory was parsed, even if the path has since been
+        replaced, and every read of it is positional.
+        """
+        self.zipfile._lock = threading.RLock()
+        self._checkpoints_lock = threading.Lock()
+        for checkpoints in self._checkpoints.values():
+            checkpoints._lock = threading.Lock()
+        for archive in self._nested.values():
+            archive._after_fork()
+
+    def open(self, info: zipfile.ZipInfo):
+        """
+        Open the member described by ``info`` for reading, or
+        return None if it must be read by ``zipfile``.
+        """
+        if info.flag_bits & 0x1:
+            return None
+        if info.compress_type == zipfile.ZIP_STORED:
+            return io.BufferedReader(StoredMember(self, info))
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            return io.BufferedReader(DeflatedMember(self, info))
+        return None
+
+
+class NestedArchive(Archive):
+    """
+    An archive held in a member of another, read in place from the
+    outer archive when stored, and otherwise inflated into memory.
+    """
+
+    def __init__(self, outer: Archive, info: zipfile.ZipInfo):
+        self.outer = outer
+        self.info = info
+        member = outer.open(info)
+        source: io.BufferedIOBase
+        if member is not None and isinstance(member.raw, StoredMember):
+            self._start: int | None = outer.data_offset(info)
+            self._data = b''
+            source = member
+        else:
+            self._start = None
+            with member or outer.zipfile.open(info) as stream:
+                self._data = stream.read()
+            source = io.BytesIO(self._data)
+        path = os.path.join(outer.path, *info.filename.split('/'))
+        super().__init__(path, source)
+
+    def read(self, offset: int, size: int) -> bytes:
+        if self._start is None:
+            return self._data[offset : offset + size]
+        size = max(min(size, self.info.file_size - offset), 0)
+        return self.outer.read(self._start + offset, size)
+
+    def locate(self, offset: int) -> tuple[int, int] | None:
+        if self._start is None:
+            return None
+        return self.outer.locate(self._start + offset)
+
+
+class PositionalFile(io.RawIOBase):
+    """
+    A read-only file keeping its own position and reading with
+    ``os.pread``, leaving the offset of the descriptor untouched.
+    """
+
+    def __init__(self, path):
+        self.name = path
+        self._file = open(path, 'rb', buffering=0)  # noqa: SIM115 closed by close()
+        self._pos = 0
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += os.fstat(self.fileno()).st_size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence!r})")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset!r}")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        data = os.pread(self.fileno(), len(view), self._pos)
+        view[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def _split_file(path: str) -> tuple[str, str]:
+    """
+    Split ``path`` into the path of a file on disk and the
+    '/'-separated names of members of archives nested in it (empty
+    for the file itself).
+    """
+    if os.path.isfile(path):
+        return path, ''
+    for match in re.finditer(r'[\\/]', path):
+        if os.path.isfile(path[: match.start()]):
+            return path[: match.start()], path[match.end() :].replace('\\', '/')
+    raise FileNotFoundError(path)
+
+
+def _close(zf, handles):
+    zf.close()
+    for handle in handles:
+        handle.close()
+
+
+_archives: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_archives_lock = threading.Lock()
+
+
+def _after_fork():
+    global _archives_lock
+    _archives_lock = threading.Lock()
+    for archive in list(_archives.values()):
+        archive._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+class Index:
+    """
+    The names in an archive, including implied directories, and
+    the children of each directory, answering membership (present
+    or absent) in O(1) and listing a directory in O(children).
+    """
+
+    def __init__(self, names):
+        self.files: set[str] = set()
+        self.children: dict[str, list[str]] = {'': []}
+        for name in names:
+            self._add(name)
+
+    def _add(self, name):
+        if name.endswith('/'):
+            if name in self.children:
+                return
+            self.children[name] = []
+        elif name in self.files:
+            return
+        else:
+            self.files.add(name)
+        parent = posixpath.dirname(name.rstrip('/'))
+        parent += '/' if parent else ''
+        if parent not in self.children:
+            self._add(parent)
+        self.children[parent].append(name)
+
+    def __contains__(self, name):
+        return name in self.files or (name in self.children and name != '')
+
+
+class Path(ZipPath):
+    """
+    A zipfile.Path reading members through a shared Archive.
+    """
+
+    def __init__(self, archive: Archive, at=''):
+        super().__init__(archive.zipfile, at)
+        self.archive = archive
+
+    def _next(self, at):
+        return self.__class__(self.archive, at)
+
+    def exists(self):
+        return self.at in self.archive.index
+
+    def is_file(self):
+        return self.at in self.archive.index.files
+
+    def iterdir(self):
+        if not self.is_dir():
+            raise ValueError("Can't listdir a file")
+        return map(self._next, self.archive.index.children.get(self.at, ()))
+
+    def joinpath(self, *other):
+        at = posixpath.join(self.at, *other)
+        index = self.archive.index
+        if at not in index and at + '/' in index.children:
+            at += '/'
+        return self._next(at)
+
+    __truediv__ = joinpath
+
+    def open(self, mode='r', *args, pwd=None, **kwargs):
+        stream = (
+            pwd is None
+            and mode in ('r', 'rb')
+            and self.is_file()
+            and self.archive.open(self.root.getinfo(self.at))
+        )
+        if not stream:
+            return super().open(mode, *args, pwd=pwd, **kwargs)
+        if 'b' in mode:
+            if args or kwargs:
+                raise ValueError("encoding args invalid for binary operation")
+            return stream
+        return io.TextIOWrapper(stream, *args, **kwargs)
+
+    def read_text(self, *args, **kwargs):
+        if args[2:] or kwargs.keys() - {'encoding', 'errors'}:
+            return super().read_text(*args, **kwargs)
+        return _text.decode(self.read_bytes(), *args, **kwargs)
+
+    def _stored_info(self):
+        """
+        Return the ZipInfo for this member if its contents are stored
+        unaltered, or None if they are not (or it is a directory).
+        """
+        if self.is_dir():
+            return None
+        try:
+            info = self.root.getinfo(self.at)
+        except KeyError:
+            raise FileNotFoundError(self.at) from None
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        return info
+
+
+@as_file.register(Path)
+def _(path, select=None):
+    """
+    Extract files to the persistent cache, when one is configured,
+    keyed by the member and its digest.
+    """
+    cache = _extract.Cache.from_environ()
+    if cache is None or not path.is_file():
+        return as_file.dispatch(object)(path, select)
+    info = path.root.getinfo(path.at)
+    identity = os.path.realpath(path.archive.path), info.filename
+    return cache.extract(
+        _extract.key((identity, digest(path))),
+        path.name,
+        functools.partial(path.open, 'rb'),
+        mode=info.external_attr >> 16 & 0o777,
+    )
+
+
+@digest.register(Path)
+def _(path):
+    """
+    Digest files by the CRC and size recorded in the archive.
+    """
+    if not path.is_file():
+        return digest.dispatch(object)(path)
+    info = path.root.getinfo(path.at)
+    return f'crc32:{info.CRC:08x}:{info.file_size}'
+
+
+@_region.file_region.register(Path)
+def _(path):
+    """
+    Stored members are held unaltered at a known offset in the
+    archive.
+    """
+    info = path._stored_info()
+    located = info and path.archive.locate(path.archive.data_offset(info))
+    if not located:
+        return None
+    fd, offset = located
+    return _region.Region(os.dup(fd), offset, info.file_size)
+
+
+@_region.read_range.register(Path)
+def _(path, offset, length):
+    """
+    Read stored members in place; others seek through their
+    checkpoints.
+    """
+    info = path._stored_info()
+    if info is None:
+        return _region.read_range.dispatch(object)(path, offset, length)
+    _region._check_range(offset, length)
+    size = max(min(length, info.file_size - offset), 0)
+    return path.archive.read(path.archive.data_offset(info) + offset, size)
+
+
+@_region.read_into.register(Path)
+def _(path, buffer):
+    """
+    Read stored members from the file holding them straight into
+    the buffer; others inflate into it chunk by chunk.
+    """
+    info = path._stored_info()
+    located = info and path.archive.locate(path.archive.data_offset(info))
+    if not located or not hasattr(os, 'preadv'):
+        return _region.read_into.dispatch(object)(path, buffer)
+    fd, offset = located
+    view = memoryview(buffer).cast('B')
+    if info.file_size > len(view):
+        raise ValueError(f"Resource does not fit in {len(view)} bytes")
+    filled = 0
+    while filled < info.file_size and (
+        count := os.preadv(fd, [view[filled : info.file_size]], offset + filled)
+    ):
+        filled += count
+    return filled
+
+
+@_generation.generation.register(Path)
+def _(path, previous=None):
+    """
+    Snapshot the CRC and size of each member, unless the archive is
+    the same one seen by the ``previous`` generation.
+    """
+    file, members = _split_file(path.archive.path)
+    stat = os.stat(file)
+    identity = stat.st_ino, stat.st_size, stat.st_mtime_ns, members
+    if previous is not None and previous.basis == identity:
+        return previous
+    archive = Archive.for_path(path.archive.path)
+    entries = {
+        info.filename[len(path.at) :]: (info.CRC, info.file_size)
+        for info in archive.zipfile.infolist()
+        if info.filename.startswith(path.at) and not info.is_dir()
+    }
+    return _generation.Generation(entries, identity)
+
+
+class Checkpoints:
+    """
+    Inflate states recorded every ``interval`` bytes of a deflated
+    member, allowing decompression to resume near any offset.
+
+    Checkpoints are recorded by any stream reading the member and
+    shared by all subsequent streams.
+    """
+
+    def __init__(self, interval: int):
+        self.interval = interval
+        self.offsets = [0]
+        self.states = [(0, zlib.decompressobj(-zlib.MAX_WBITS))]
+        self._lock = threading.Lock()
+
+    def nearest(self, offset):
+        """
+        Return the uncompressed offset, compressed offset, and
+        decompressor for the last checkpoint at or before ``offset``.
+
+        The decompressor is shared; copy it before resuming from it.
+        """
+        index = bisect.bisect_right(self.offsets, offset) - 1
+        consumed, state = self.states[index]
+        return self.offsets[index], consumed, state
+
+    def record(self, offset, consumed, state):
+        if offset <= self.offsets[-1]:
+            return
+        with self._lock:
+            if offset > self.offsets[-1]:
+                self.states.append((consumed, state.copy()))
+                self.offsets.append(offset)
+
+
+class Member(io.RawIOBase):
+    """
+    A seekable stream over a member of an Archive.
+    """
+
+    def __init__(self, archive: Archive, info: zipfile.ZipInfo):
+        self._archive = archive
+        self._info = info
+        self._start = archive.data_offset(info)
+        self._pos = 0
+        self._target = 0
+        self._crc: int | None = 0
+
+    @property
+    def name(self):
+        return self._info.filename
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._target
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._target
+        elif whence == io.SEEK_END:
+            offset += self._info.file_size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence!r})")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset!r}")
+        self._target = offset
+        return offset
+
+    def readinto(self, buffer):
+        self._sync()
+        view = memoryview(buffer).cast('B')
+        data = self._read(min(len(view), self._info.file_size - self._pos))
+        view[: len(data)] = data
+        self._target = self._pos
+        self._check_crc(data)
+        return len(data)
+
+    def readall(self):
+        self._sync()
+        chunks = []
+        while data := self._read(self._info.file_size - self._pos):
+            self._check_crc(data)
+            chunks.append(data)
+        self._target = self._pos
+        return b''.join(chunks)
+
+    def _sync(self):
+        """
+        Move to the requested position.
+        """
+        if self._target != self._pos:
+            self._pos = min(self._target, self._info.file_size)
+            self._crc = None
+
+    def _read(self, size):
+        raise NotImplementedError  # pragma: no cover
+
+    def _check_crc(self, data):
+        """
+        Verify the CRC when the member is read through from the start.
+        """
+        if self._crc is None:
+            return
+        self._crc = zlib.crc32(data, self._crc)
+        if self._pos == self._info.file_size and self._crc != self._info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {self.name!r}")
+
+
+class StoredMember(Member):
+    """
+    A stream over a stored (uncompressed) member, read in place.
+    """
+
+    def _read(self, size):
+        data = self._archive.read(self._start + self._pos, size)
+        self._pos += len(data)
+        return data
+
+
+class DeflatedMember(Member):
+    """
+    A stream over a deflated member.
+
+    Seeking resumes inflation from the nearest checkpoint, making
+    random access cost O(interval) rather than O(offset). Only
+    streams that have seeked record checkpoints, so that reading a
+    member through retains no inflate states.
+    """
+
+    def __init__(self, archive: Archive, info: zipfile.ZipInfo, interval=None):
+        super().__init__(archive, info)
+        self._checkpoints = archive.checkpoints(info, interval or CHECKPOINT_INTERVAL)
+        self._consumed = 0
+        self._pending = b''
+        self._state = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._seeked = False
+
+    def _sync(self):
+        """
+        Advance the decompressor to the requested position, resuming
+        from a checkpoint if one is closer than the current state.
+        """
+        target = min(self._target, self._info.file_size)
+        if target == self._pos:
+            return
+        self._seeked = True
+        offset, consumed, state = self._checkpoints.nearest(target)
+        if target < self._pos or offset > self._pos:
+            self._pos, self._consumed, self._state = offset, consumed, state.copy()
+            self._pending = b''
+            self._crc = None
+        while self._pos < target:
+            data = self._read(min(target - self._pos, _CHUNK))
+            if not data:
+                # the member ended short of its recorded size
+                break
+            self._check_crc(data)
+
+    def _read(self, size):
+        """
+        Inflate up to ``size`` bytes, stopping at the next checkpoint.
+        """
+        interval = self._checkpoints.interval
+        size = min(size, interval - self._pos % interval)
+        data = b''
+        while size > 0 and not data and not self._state.eof:
+            if not self._pending:
+                self._pending = self._read_compressed()
+            data = self._state.decompress(self._pending, size)
+            self._consumed += len(self._pending) - len(self._state.unconsumed_tail)
+            self._pending = self._state.unconsumed_tail
+        self._pos += len(data)
+        if self._seeked and self._pos % interval == 0:
+            self._checkpoints.record(self._pos, self._consumed, self._state)
+        return data
+
+    def _read_compressed(self):
+        remaining = self._info.compress_size - self._consumed
+        if remaining <= 0:
+            raise EOFError(f"Compressed data ended before the end of {self.name}")
+        return self._archive.read(self._start + self._consumed, min(remaining, _CHUNK))
@@ -16,6 +16,8 @@ from typing import (
     runtime_checkable,
 )
 
+from . import _text
+
 StrPath = str | os.PathLike[str]
 
 __all__ = ["ResourceReader", "Traversable", "TraversableResources"]
@@ -77,6 +79,8 @@ class Traversable(Protocol):
     may propagate unaltered.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def iterdir(self) -> Iterator["Traversable"]:
         """
@@ -96,8 +100,7 @@ class Traversable(Protocol):
         """
         Read contents of self as text
         """
-        with self.open(encoding=encoding, errors=errors) as strm:
-            return strm.read()
+        return _text.decode(self.read_bytes(), encoding, errors)
 
     @abc.abstractmethod
     def is_dir(self) -> bool:
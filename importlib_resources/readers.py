@@ -4,14 +4,15 @@ import collections
 import contextlib
 import itertools
 import operator
+import os
 import pathlib
 import re
+import time
 import warnings
-from collections.abc import Iterator
+import zipfile
+from collections.abc import Collection, Iterator
 
-from . import abc
-from ._itertools import only
-from .compat.py39 import ZipPath
+from . import _generation, _zip, abc
 
 
 def remove_duplicates(items):
@@ -49,15 +50,10 @@ class ZipReader(abc.TraversableResources):
             raise FileNotFoundError(exc.args[0])
 
     def is_resource(self, path):
-        """
-        Workaround for `zipfile.Path.is_file` returning true
-        for non-existent paths.
-        """
-        target = self.files().joinpath(path)
-        return target.is_file() and target.exists()
+        return self.files().joinpath(path).is_file()
 
     def files(self):
-        return ZipPath(self.archive, self.prefix)
+        return _zip.Path(_zip.Archive.for_path(self.archive), self.prefix)
 
 
 class MultiplexedPath(abc.Traversable):
@@ -68,8 +64,10 @@ class MultiplexedPath(abc.Traversable):
     name.
     """
 
+    __slots__ = ('_paths',)
+
     def __init__(self, *paths):
-        self._paths = list(map(_ensure_traversable, remove_duplicates(paths)))
+        self._paths = tuple(map(_ensure_traversable, remove_duplicates(paths)))
         if not self._paths:
             message = 'MultiplexedPath must contain at least one path'
             raise FileNotFoundError(message)
@@ -77,8 +75,11 @@ class MultiplexedPath(abc.Traversable):
             raise NotADirectoryError('MultiplexedPath only supports directories')
 
     def iterdir(self):
-        children = (child for path in self._paths for child in path.iterdir())
         by_name = operator.attrgetter('name')
+        if len(self._paths) == 1:
+            # names are unique within a sole portion
+            return iter(sorted(self._paths[0].iterdir(), key=by_name))
+        children = (child for path in self._paths for child in path.iterdir())
         groups = itertools.groupby(sorted(children, key=by_name), key=by_name)
         return map(self._follow, (locs for name, locs in groups))
 
@@ -95,12 +96,17 @@ class MultiplexedPath(abc.Traversable):
         return False
 
     def joinpath(self, *descendants):
-        try:
-            return super().joinpath(*descendants)
-        except abc.TraversalError:
-            # One of the paths did not resolve (a directory does not exist).
+        if not descendants:
+            return self
+        target, *rest = itertools.chain.from_iterable(
+            pathlib.PurePosixPath(path).parts for path in descendants
+        )
+        holders = [path for path in self._paths if target in _names(path)]
+        if not holders:
+            # The target does not exist in any portion.
             # Just return something that will not exist.
             return self._paths[0].joinpath(*descendants)
+        return self._follow(path.joinpath(target) for path in holders).joinpath(*rest)
 
     @classmethod
     def _follow(cls, children):
@@ -111,15 +117,15 @@ class MultiplexedPath(abc.Traversable):
         Otherwise, return a MultiplexedPath of the items.
         Unless one of the items is not a Directory, then return the first.
         """
-        subdirs, one_dir, one_file = itertools.tee(children, 3)
-
+        children = iter(children)
+        first = next(children, None)
+        second = next(children, None)
+        if second is None:
+            return first
         try:
-            return only(one_dir)
-        except ValueError:
-            try:
-                return cls(*subdirs)
-            except NotADirectoryError:
-                return next(one_file)
+            return cls(first, second, *children)
+        except NotADirectoryError:
+            return first
 
     def open(self, *args, **kwargs):
         raise FileNotFoundError(f'{self} is not a file')
@@ -133,6 +139,42 @@ class MultiplexedPath(abc.Traversable):
         return f'MultiplexedPath({paths})'
 
 
+_listings: dict[str, tuple[int, frozenset[str]]] = {}
+
+
+def _names(path) -> Collection[str]:
+    """
+    Return the names in a portion, listing a directory on disk
+    again only when its modification time changes.
+    """
+    if not isinstance(path, pathlib.Path):
+        return {child.name for child in path.iterdir()}
+    key = os.fspath(path)
+    mtime = os.stat(key).st_mtime_ns
+    with contextlib.suppress(KeyError):
+        cached_mtime, names = _listings[key]
+        if cached_mtime == mtime:
+            return names
+    names = frozenset(os.listdir(key))
+    if time.time_ns() - mtime > _generation.RACY_NS:
+        _listings[key] = mtime, names
+    return names
+
+
+@_generation.generation.register
+def _(path: MultiplexedPath, previous=None):
+    """
+    Merge the generations of each portion, the first portion
+    holding a name taking precedence as it does in ``joinpath``.
+    """
+    known = itertools.chain(previous.basis if previous else (), itertools.repeat(None))
+    parts = tuple(map(_generation.generation, path._paths, known))
+    entries = {}
+    for part in reversed(parts):
+        entries.update(part.entries)
+    return _generation.Generation(entries, parts)
+
+
 class NamespaceReader(abc.TraversableResources):
     def __init__(self, namespace_path):
         if 'NamespacePath' not in str(namespace_path):
@@ -162,15 +204,21 @@ class NamespaceReader(abc.TraversableResources):
 
     @staticmethod
     def _resolve_zip_path(path_str: str):
+        """
+        Generate paths into the archives (including archives nested
+        in archives) that ``path_str`` may lead into.
+        """
         for match in reversed(list(re.finditer(r'[\\/]', path_str))):
             with contextlib.suppress(
                 FileNotFoundError,
                 IsADirectoryError,
                 NotADirectoryError,
                 PermissionError,
+                zipfile.BadZipFile,
             ):
                 inner = path_str[match.end() :].replace('\\', '/') + '/'
-                yield ZipPath(path_str[: match.start()], inner.lstrip('/'))
+                archive = _zip.Archive.for_path(path_str[: match.start()])
+                yield _zip.Path(archive, inner.lstrip('/'))
 
     def resource_path(self, resource):
         """
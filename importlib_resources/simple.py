@@ -3,11 +3,15 @@ Interface adapters for low-level readers.
 """
 
 import abc
+import functools
 import io
 import itertools
-from typing import BinaryIO
+import pathlib
+from collections.abc import Mapping
+from typing import BinaryIO, Union
 
-from .abc import Traversable, TraversableResources
+from . import _tree
+from .abc import Traversable, TraversableResources, TraversalError
 
 
 class SimpleReader(abc.ABC):
@@ -42,19 +46,41 @@ class SimpleReader(abc.ABC):
         Obtain a File-like for a named resource.
         """
 
+    def tree(self) -> 'Listing | None':
+        """
+        Optionally, obtain the whole listing of this virtual package
+        in one call, as a mapping of resource names to their sizes
+        and of child container names to mappings of the same form.
+
+        Readers supplying a tree must accept paths relative to this
+        package and separated by ``/`` in ``open_binary``. Return None
+        (the default) to have the listing gathered from ``resources``
+        and ``children`` instead.
+        """
+        return None
+
     @property
     def name(self):
         return self.package.split('.')[-1]
 
 
+Listing = Mapping[str, Union[int, 'Listing']]
+
+
 class ResourceContainer(Traversable):
     """
     Traversable container for a package's resources via its reader.
     """
 
+    __slots__ = ('reader',)
+
     def __init__(self, reader: SimpleReader):
         self.reader = reader
 
+    @property
+    def name(self):
+        return self.reader.name
+
     def is_dir(self):
         return True
 
@@ -69,15 +95,76 @@ class ResourceContainer(Traversable):
     def open(self, *args, **kwargs):
         raise IsADirectoryError()
 
+    def _open_binary(self, name: str) -> BinaryIO:
+        return self.reader.open_binary(name)
+
+
+class ListedContainer(ResourceContainer):
+    """
+    Traversable container for a directory (``node``) in a compact
+    index of the listing obtained from ``SimpleReader.tree()``.
+    """
+
+    __slots__ = ('node', 'tree')
+
+    def __init__(self, reader: SimpleReader, tree: _tree.Tree, node: int = 0):
+        super().__init__(reader)
+        self.tree = tree
+        self.node = node
+
+    @property
+    def name(self):
+        return self.tree.name(self.node) if self.node else self.reader.name
+
+    def iterdir(self):
+        return map(self._entry, self.tree.children(self.node))
+
+    def joinpath(self, *descendants):
+        """
+        Look up each name in the index, rather than listing each
+        directory on the way.
+        """
+        names = itertools.chain.from_iterable(
+            path.parts for path in map(pathlib.PurePosixPath, descendants)
+        )
+        node = self.node
+        for target in names:
+            node = self.tree.child(node, target)
+            if node < 0:
+                raise TraversalError(
+                    "Target not found during traversal.", target, list(names)
+                )
+            if not self.tree.is_dir(node):
+                return self._entry(node).joinpath(*names)
+        return self if node == self.node else self._entry(node)
+
+    def _entry(self, node: int) -> Traversable:
+        if self.tree.is_dir(node):
+            return ListedContainer(self.reader, self.tree, node)
+        parent = self.tree.parents[node]
+        if parent != self.node:
+            return ListedContainer(self.reader, self.tree, parent)._entry(node)
+        return ResourceHandle(self, self.tree.name(node), self.tree.sizes[node])
+
+    def _open_binary(self, name: str) -> BinaryIO:
+        return self.reader.open_binary(self.tree.path(self.node) + name)
+
 
 class ResourceHandle(Traversable):
     """
     Handle to a named resource in a ResourceReader.
     """
 
-    def __init__(self, parent: ResourceContainer, name: str):
+    __slots__ = ('_name', 'parent', 'size')
+
+    def __init__(self, parent: ResourceContainer, name: str, size: int | None = None):
         self.parent = parent
-        self.name = name  # type: ignore[misc]
+        self._name = name
+        self.size = size
+
+    @property
+    def name(self):
+        return self._name
 
     def is_file(self):
         return True
@@ -85,13 +172,18 @@ class ResourceHandle(Traversable):
     def is_dir(self):
         return False
 
+    def iterdir(self):
+        return iter(())
+
     def open(self, mode='r', *args, **kwargs):
-        stream = self.parent.reader.open_binary(self.name)
+        stream = self.parent._open_binary(self.name)
         if 'b' not in mode:
             stream = io.TextIOWrapper(stream, *args, **kwargs)
         return stream
 
-    def joinpath(self, name):
+    def joinpath(self, *descendants):
+        if not descendants:
+            return self
         raise RuntimeError("Cannot traverse into a resource")
 
 
@@ -103,4 +195,24 @@ class TraversableReader(TraversableResources, SimpleReader):
     """
 
     def files(self):
-        return ResourceContainer(self)
+        if self._index is None:
+            return ResourceContainer(self)
+        return ListedContainer(self, self._index)
+
+    @functools.cached_property
+    def _index(self) -> _tree.Tree | None:
+        listing = self.tree()
+        return None if listing is None else _tree.Tree(_entries(listing))
+
+
+def _entries(listing: Listing, prefix: str = ''):
+    """
+    Flatten a listing into (name, size) pairs, naming directories
+    with a trailing slash.
+    """
+    for name, entry in listing.items():
+        if isinstance(entry, Mapping):
+            yield f'{prefix}{name}/', _tree.DIRECTORY
+            yield from _entries(entry, f'{prefix}{name}/')
+        else:
+            yield prefix + name, entry
@@ -1,3 +1,4 @@
+import collections
 import io
 import unittest
 
@@ -58,6 +59,10 @@ class CompatibilityFilesTests(unittest.TestCase):
         assert (self.files / 'a' / 'b').name == 'b'
         assert (self.files / 'a' / 'b' / 'c').name == 'c'
 
+    def test_slots(self):
+        for path in (self.files, self.files / 'a', self.files / 'a' / 'b'):
+            assert not hasattr(path, '__dict__')
+
     def test_spec_path_open(self):
         assert self.files.read_bytes() == b'Hello, world!'
         assert self.files.read_text(encoding='utf-8') == 'Hello, world!'
@@ -96,3 +101,50 @@ class CompatibilityFilesNoReaderTests(unittest.TestCase):
 
     def test_spec_path_joinpath(self):
         assert isinstance(self.files / 'a', CompatibilityFiles.OrphanPath)
+
+
+class CountingReader(util.Reader):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = collections.Counter()
+
+    def get_resource_reader(self, package):
+        self.calls['get_resource_reader'] += 1
+        return super().get_resource_reader(package)
+
+    def is_resource(self, path_):
+        self.calls['is_resource'] += 1
+        return super().is_resource(path_)
+
+    def contents(self):
+        self.calls['contents'] += 1
+        return super().contents()
+
+
+class CompatibilityFilesMemoizationTests(unittest.TestCase):
+    def setUp(self):
+        self.reader = CountingReader(
+            file=io.BytesIO(b'Hello, world!'), path='some_path', _contents=('a', 'b')
+        )
+        package = util.create_package_from_loader(self.reader)
+        self.files = CompatibilityFiles(package.__spec__)
+
+    def test_reader_memoized(self):
+        self.files.files()
+        self.files.resource_path('a')
+        self.files.files()
+        assert self.reader.calls['get_resource_reader'] == 1
+
+    def test_contents_memoized(self):
+        root = self.files.files()
+        for _ in range(3):
+            assert sorted(path.name for path in root.iterdir()) == ['a', 'b']
+        assert self.reader.calls['contents'] == 1
+
+    def test_is_resource_memoized(self):
+        root = self.files.files()
+        for _ in range(3):
+            assert (root / 'a').is_file()
+            assert not (root / 'a').is_dir()
+            assert not (root / 'missing').is_file()
+        assert self.reader.calls['is_resource'] == 2
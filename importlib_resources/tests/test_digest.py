@@ -0,0 +1,62 @@
+import hashlib
+import unittest
+from unittest import mock
+
+from importlib_resources import _digest, digest, files
+
+from . import util
+
+
+class DigestTests:
+    def test_file(self):
+        data = files(self.data)
+        assert digest(data / 'binary.file') == digest(data / 'binary.file')
+        assert digest(data / 'binary.file') != digest(data / 'utf-8.file')
+
+    def test_tree(self):
+        data = files(self.data)
+        assert digest(data).startswith('tree:')
+        assert digest(data) == digest(data)
+        assert digest(data) != digest(data / 'subdirectory')
+
+
+class DigestDiskTests(DigestTests, util.DiskSetup, unittest.TestCase):
+    def test_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            digest(files(self.data) / 'missing.file')
+
+    def test_file_cached(self):
+        resource = files(self.data) / 'binary.file'
+        digest(resource)
+        with mock.patch.object(_digest, '_hash') as hash:
+            digest(resource)
+        hash.assert_not_called()
+
+    def test_changed(self):
+        data = files(self.data)
+        before = digest(data), digest(data / 'subdirectory' / 'binary.file')
+        (data / 'subdirectory' / 'binary.file').write_bytes(b'changed')
+        after = digest(data), digest(data / 'subdirectory' / 'binary.file')
+        assert not set(before) & set(after)
+
+
+class DigestZipTests(DigestTests, util.ZipSetup, unittest.TestCase):
+    def test_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            digest(files(self.data) / 'missing.file')
+
+    def test_crc(self):
+        resource = files(self.data) / 'binary.file'
+        crc = resource.root.getinfo(resource.at).CRC
+        assert digest(resource) == f'crc32:{crc:08x}:4'
+
+
+class DigestMemoryTests(DigestTests, util.MemorySetup, unittest.TestCase):
+    def test_streamed(self):
+        resource = files(self.data) / 'binary.file'
+        expected = hashlib.sha256(resource.read_bytes()).hexdigest()
+        assert digest(resource) == f'sha256:{expected}'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,12 @@
+import functools
+import gc
 import importlib
 import os
 import unittest
+from multiprocessing import shared_memory
 
 import importlib_resources as resources
+from importlib_resources import _functional, _shared
 
 from . import util
 from .compat.py39 import warnings_helper
@@ -107,6 +111,14 @@ class FunctionalAPIBase:
         for path_parts in self._gen_resourcetxt_path_parts():
             assert resources.read_binary(self.anchor02, *path_parts) == b'a resource'
 
+    def test_read_binary_into(self):
+        buffer = bytearray(64)
+        size = resources.read_binary_into(self.anchor01, 'utf-8.file', buffer=buffer)
+        assert buffer[:size] == b'Hello, UTF-8 world!\n'
+        for path_parts in self._gen_resourcetxt_path_parts():
+            size = resources.read_binary_into(self.anchor02, *path_parts, buffer=buffer)
+            assert buffer[:size] == b'a resource'
+
     def test_open_text(self):
         with resources.open_text(self.anchor01, 'utf-8.file') as f:
             assert f.read() == 'Hello, UTF-8 world!\n'
@@ -161,6 +173,26 @@ class FunctionalAPIBase:
             with open(os.path.join(path, 'utf-8.file'), encoding='utf-8') as f:
                 assert f.read() == 'Hello, UTF-8 world!\n'
 
+    def test_freeze(self):
+        self.addCleanup(_functional._frozen.clear)
+        view = resources.freeze(self.anchor01, 'utf-8.file')
+        assert view == b'Hello, UTF-8 world!\n'
+        assert view.readonly
+        assert resources.freeze(self.anchor01, 'utf-8.file') is view
+        for path_parts in self._gen_resourcetxt_path_parts():
+            assert resources.freeze(self.anchor02, *path_parts) == b'a resource'
+
+    def test_open_shared(self):
+        with resources.open_shared(self.anchor01, 'utf-8.file') as shared:
+            assert shared.view == b'Hello, UTF-8 world!\n'
+            assert shared.view.readonly
+            with resources.open_shared(self.anchor01, 'utf-8.file') as other:
+                assert other.name == shared.name
+                assert other.view == shared.view
+        for path_parts in self._gen_resourcetxt_path_parts():
+            with resources.open_shared(self.anchor02, *path_parts) as shared:
+                assert shared.view == b'a resource'
+
     def test_is_resource(self):
         is_resource = resources.is_resource
         assert is_resource(self.anchor01, 'utf-8.file')
@@ -170,6 +202,56 @@ class FunctionalAPIBase:
         for path_parts in self._gen_resourcetxt_path_parts():
             assert is_resource(self.anchor02, *path_parts)
 
+    def test_iter_lines(self):
+        lines = resources.iter_lines(self.anchor01, 'utf-8.file')
+        assert list(lines) == ['Hello, UTF-8 world!\n']
+        lines = resources.iter_lines(self.anchor01, 'utf-16.file', encoding='utf-16')
+        assert list(lines) == ['Hello, UTF-16 world!\n']
+        with self.assertRaises(TypeError):
+            resources.iter_lines(
+                self.anchor02, 'subdirectory', 'subsubdir', 'resource.txt'
+            )
+
+    def test_iter_chunks(self):
+        chunks = resources.iter_chunks(self.anchor01, 'utf-8.file', size=5)
+        assert list(chunks) == [b'Hello', b', UTF', b'-8 wo', b'rld!\n']
+
+    def test_is_resource_many(self):
+        names = [
+            'utf-8.file',
+            'subdirectory',
+            'no_such_file',
+            ('subdirectory', 'binary.file'),
+        ]
+        assert resources.is_resource_many(self.anchor01, names) == {
+            'utf-8.file': True,
+            'subdirectory': False,
+            'no_such_file': False,
+            ('subdirectory', 'binary.file'): True,
+        }
+
+    def test_classify_many(self):
+        names = [
+            'utf-8.file',
+            'subdirectory',
+            'subdirectory/binary.file',
+            'no_such_file',
+            'no_such_dir/file',
+            'utf-8.file/file',
+            '',
+        ]
+        assert resources.classify_many(self.anchor01, names) == {
+            'utf-8.file': 'file',
+            'subdirectory': 'dir',
+            'subdirectory/binary.file': 'file',
+            'no_such_file': 'missing',
+            'no_such_dir/file': 'missing',
+            'utf-8.file/file': 'missing',
+            '': 'dir',
+        }
+        with self.assertRaises(TypeError):
+            resources.classify_many(None, names)
+
     def test_contents(self):
         with warnings_helper.check_warnings((".*contents.*", DeprecationWarning)):
             c = resources.contents(self.anchor01)
@@ -206,6 +288,11 @@ class FunctionalAPIBase:
             resources.path,
             resources.is_resource,
             resources.contents,
+            resources.freeze,
+            resources.open_shared,
+            resources.iter_chunks,
+            resources.iter_lines,
+            functools.partial(resources.read_binary_into, buffer=bytearray(64)),
         ):
             with self.subTest(func=func):
                 # Rejecting None anchor
@@ -234,6 +321,97 @@ class FunctionalAPIBase:
                     )
 
 
+@unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+class FreezeForkTests(util.DiskSetup, unittest.TestCase):
+    def test_shared_with_child(self):
+        self.addCleanup(_functional._frozen.clear)
+        view = resources.freeze(self.data, 'utf-8.file')
+        pid = os.fork()
+        if not pid:  # pragma: no cover
+            os._exit(resources.freeze(self.data, 'utf-8.file') is not view)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+
+class SharedTests(util.DiskSetup, unittest.TestCase):
+    def test_released_by_last_user(self):
+        shared = resources.open_shared(self.data, 'binary.file')
+        other = resources.open_shared(self.data, 'binary.file')
+        shared.close()
+        assert other.view == bytes(range(4))
+        other.close()
+        other.close()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(shared.name).close()
+
+    def test_released_when_collected(self):
+        shared = resources.open_shared(self.data, 'binary.file')
+        name, view = shared.name, shared.view
+        del shared
+        gc.collect()
+        assert view == bytes(range(4))
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name).close()
+        other = resources.open_shared(self.data, 'binary.file')
+        del other
+        gc.collect()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name).close()
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_attached_by_child(self):
+        with resources.open_shared(self.data, 'binary.file') as shared:
+            pid = os.fork()
+            if not pid:  # pragma: no cover
+                with resources.open_shared(self.data, 'binary.file') as other:
+                    failed = other.view != bytes(range(4))
+                os._exit(failed)
+            _, status = os.waitpid(pid, 0)
+            assert os.waitstatus_to_exitcode(status) == 0
+            assert shared.view == bytes(range(4))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_user_died(self):
+        """
+        A user that dies without detaching keeps the segment only for
+        as long as the others, or until the next segment is published.
+        """
+
+        def die_attached():
+            pid = os.fork()
+            if not pid:  # pragma: no cover
+                shared = resources.open_shared(self.data, 'binary.file')  # noqa: F841
+                os._exit(0)
+            os.waitpid(pid, 0)
+
+        def exists(name):
+            try:
+                _shared._attach(name).close()
+            except FileNotFoundError:
+                return False
+            return True
+
+        shared = resources.open_shared(self.data, 'binary.file')
+        die_attached()
+        shared.close()
+        assert not exists(shared.name)
+
+        die_attached()
+        assert exists(shared.name)
+        target = resources.files(self.data) / 'binary.file'
+        target.write_bytes(b'changed contents')
+        with resources.open_shared(self.data, 'binary.file'):
+            assert not exists(shared.name)
+
+    def test_changed_contents(self):
+        with resources.open_shared(self.data, 'binary.file') as shared:
+            target = resources.files(self.data) / 'binary.file'
+            target.write_bytes(b'changed contents')
+            with resources.open_shared(self.data, 'binary.file') as other:
+                assert other.name != shared.name
+                assert other.view == b'changed contents'
+
+
 class FunctionalAPITest_StringAnchor_Disk(
     StringAnchorMixin,
     FunctionalAPIBase,
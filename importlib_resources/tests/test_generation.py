@@ -0,0 +1,100 @@
+import os
+import pathlib
+import unittest
+import zipfile
+from unittest import mock
+
+from importlib_resources import files, generation
+from importlib_resources.readers import MultiplexedPath
+
+from . import util
+
+
+class GenerationTests:
+    def test_unchanged(self):
+        first = generation(files(self.data))
+        second = generation(files(self.data), first)
+        assert second == first
+        assert not second.changed_since(first)
+        assert 'subdirectory/binary.file' in first.entries
+
+
+class GenerationDiskTests(GenerationTests, util.DiskSetup, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = pathlib.Path(self.data.__file__).parent
+
+    def test_changed(self):
+        first = generation(files(self.data))
+        (self.root / 'subdirectory' / 'binary.file').write_bytes(b'changed')
+        (self.root / 'utf-8.file').unlink()
+        (self.root / 'subdirectory' / 'new.file').write_bytes(b'new')
+        assert generation(files(self.data), first).changed_since(first) == {
+            'subdirectory/binary.file',
+            'subdirectory/new.file',
+            'utf-8.file',
+        }
+
+    def backdate(self):
+        for directory in [self.root, *self.root.glob('**/')]:
+            os.utime(directory, ns=(0, 10**9))
+
+    def test_pruned(self):
+        self.backdate()
+        first = generation(files(self.data))
+        with mock.patch.object(os, 'scandir', side_effect=AssertionError):
+            generation(files(self.data), first)
+
+    def test_racy(self):
+        """
+        A file added within the same modification time as a recently
+        modified directory is still seen.
+        """
+        first = generation(files(self.data))
+        mtime = self.root.stat().st_mtime_ns
+        (self.root / 'new.file').write_bytes(b'new')
+        os.utime(self.root, ns=(mtime, mtime))
+        assert generation(files(self.data), first).changed_since(first) == {'new.file'}
+
+
+class GenerationZipTests(GenerationTests, util.ZipSetup, unittest.TestCase):
+    def test_same_archive(self):
+        first = generation(files(self.data))
+        assert generation(files(self.data), first) is first
+
+    def test_changed(self):
+        root = files(self.data)
+        first = generation(root)
+        with zipfile.ZipFile(root.archive.path) as zf:
+            members = {info: zf.read(info) for info in zf.infolist()}
+        with zipfile.ZipFile(root.archive.path, 'w') as zf:
+            for info, data in members.items():
+                changed = info.filename == 'data01/utf-8.file'
+                zf.writestr(info, b'changed' if changed else data)
+            zf.writestr('data01/new.file', b'new')
+        assert generation(root, first).changed_since(first) == {
+            'utf-8.file',
+            'new.file',
+        }
+
+
+class GenerationMemoryTests(GenerationTests, util.MemorySetup, unittest.TestCase):
+    pass
+
+
+class GenerationNamespaceTests(util.DiskSetup, unittest.TestCase):
+    MODULE = 'namespacedata01'
+
+    def test_portions(self):
+        data01 = pathlib.Path(self.load_fixture('data01').__file__).parent
+        folder = pathlib.Path(self.data.__path__[0])
+        path = MultiplexedPath(folder, data01)
+        first = generation(path)
+        assert '__init__.py' in first.entries
+        (data01 / 'binary.file').write_bytes(b'shadowed')
+        (data01 / '__init__.py').write_bytes(b'changed')
+        assert generation(path, first).changed_since(first) == {'__init__.py'}
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import datetime
+import json
+import marshal
+import os
+import pathlib
+import sys
+import unittest
+from unittest import mock
+
+import importlib_resources as resources
+from importlib_resources import _extract
+
+from . import util
+from .compat.py39 import os_helper
+
+
+class LoaderTests(util.DiskSetup, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(resources.load_cache_clear)
+        resources.load_cache_clear()
+        self.root = pathlib.Path(self.data.__file__).parent
+        (self.root / 'schema.json').write_text(
+            '{"type": "object", "required": ["name"], "nested": {"n": [1, 2]}}',
+            encoding='utf-8',
+        )
+        (self.root / 'config.toml').write_text(
+            'title = "config"\n[server]\nports = [80, 443]\n', encoding='utf-8'
+        )
+        (self.root / 'table.csv').write_bytes(b'a,b\r\n1,"two\r\nlines"\r\n')
+
+    def test_json(self):
+        schema = resources.load_json(self.data, 'schema.json')
+        assert schema['required'] == ('name',)
+        assert schema['nested']['n'] == (1, 2)
+        with self.assertRaises(TypeError):
+            schema['type'] = 'array'
+
+    def test_toml(self):
+        config = resources.load_toml(self.data, 'config.toml')
+        assert config['server']['ports'] == (80, 443)
+        with self.assertRaises(TypeError):
+            config['server']['host'] = 'localhost'
+
+    def test_toml_unavailable(self):
+        modules = {'importlib_resources.compat.py310': None}
+        with (
+            mock.patch.dict(sys.modules, modules),
+            self.assertRaisesRegex(ImportError, r'importlib_resources\[toml\]'),
+        ):
+            resources.load_toml(self.data, 'config.toml')
+
+    def test_csv(self):
+        rows = resources.load_csv(self.data, 'table.csv')
+        assert rows == (('a', 'b'), ('1', 'two\r\nlines'))
+        rows = resources.load_csv(self.data, 'table.csv', delimiter=';')
+        assert rows[0] == ('a,b',)
+
+    def test_memoized(self):
+        first = resources.load_json(self.data, 'schema.json')
+        assert resources.load_json(self.data, 'schema.json') is first
+        info = resources.load_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.nbytes > 0
+
+    def test_changed(self):
+        resources.load_json(self.data, 'schema.json')
+        (self.root / 'schema.json').write_text('{"type": "array"}', encoding='utf-8')
+        assert resources.load_json(self.data, 'schema.json') == {'type': 'array'}
+        assert resources.load_cache_info().misses == 2
+
+
+@unittest.skipUnless(_extract.fcntl, 'requires fcntl')
+class CompiledTests(LoaderTests):
+    def setUp(self):
+        super().setUp()
+        self.cache = pathlib.Path(self.fixtures.enter_context(os_helper.temp_dir()))
+        environ = {'IMPORTLIB_RESOURCES_CACHE': str(self.cache)}
+        self.fixtures.enter_context(mock.patch.dict(os.environ, environ))
+
+    def compiled(self):
+        return list(self.cache.glob('parsed/*/parsed'))
+
+    def test_compiled(self):
+        first = resources.load_json(self.data, 'schema.json')
+        (compiled,) = self.compiled()
+        resources.load_cache_clear()
+        with mock.patch.object(json, 'loads', side_effect=AssertionError):
+            assert resources.load_json(self.data, 'schema.json') == first
+        assert self.compiled() == [compiled]
+
+    def test_pickled(self):
+        (self.root / 'dated.toml').write_text('day = 2024-01-02\n', encoding='utf-8')
+        resources.load_toml(self.data, 'dated.toml')
+        resources.load_cache_clear()
+        config = resources.load_toml(self.data, 'dated.toml')
+        assert config['day'] == datetime.date(2024, 1, 2)
+
+    def test_corrupt(self):
+        resources.load_csv(self.data, 'table.csv')
+        (compiled,) = self.compiled()
+        compiled.write_bytes(b'M\x00')
+        resources.load_cache_clear()
+        assert resources.load_csv(self.data, 'table.csv')[0] == ('a', 'b')
+        assert not self.compiled()
+        resources.load_cache_clear()
+        resources.load_csv(self.data, 'table.csv')
+        (compiled,) = self.compiled()
+        assert compiled.read_bytes() != b'M\x00'
+
+    def test_corrupt_pickle(self):
+        (self.root / 'dated.toml').write_text('day = 2024-01-02\n', encoding='utf-8')
+        resources.load_toml(self.data, 'dated.toml')
+        (compiled,) = self.compiled()
+        good = compiled.read_bytes()
+        corruptions = (
+            b'P\x00',
+            good[: len(good) // 2],
+            good.replace(b'datetime', b'datetimX'),
+            b'M' + marshal.dumps(1),
+        )
+        for corrupt in corruptions:
+            with self.subTest(corrupt=corrupt):
+                compiled.write_bytes(corrupt)
+                resources.load_cache_clear()
+                config = resources.load_toml(self.data, 'dated.toml')
+                assert config['day'] == datetime.date(2024, 1, 2)
+                resources.load_cache_clear()
+                resources.load_toml(self.data, 'dated.toml')
+                assert compiled.read_bytes() == good
+
+    def test_invalid(self):
+        (self.root / 'bad.json').write_text('{', encoding='utf-8')
+        with (
+            mock.patch.object(json, 'loads', wraps=json.loads) as loads,
+            self.assertRaises(ValueError),
+        ):
+            resources.load_json(self.data, 'bad.json')
+        assert loads.call_count == 1
+        assert not list(self.cache.rglob('.tmp-*'))
+        assert not self.compiled()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
 import os.path
 import pathlib
+import time
 import unittest
 from importlib import import_module
+from unittest import mock
 
+from importlib_resources import as_file
 from importlib_resources.readers import MultiplexedPath, NamespaceReader
 
 from . import util
@@ -92,12 +95,68 @@ class MultiplexedPathTest(util.DiskSetup, unittest.TestCase):
             os.path.join('data02', 'subdirectory', 'subsubdir')
         )
 
+    def test_join_path_absent(self):
+        old = time.time() - 60
+        for portion in self.folder, self.data01:
+            os.utime(portion, (old, old))
+        path = MultiplexedPath(self.folder, self.data01)
+        assert not path.joinpath('override.yaml').exists()
+        with mock.patch.object(os, 'listdir', side_effect=AssertionError):
+            assert not path.joinpath('override.yaml').exists()
+            assert path.joinpath('binary.file').is_file()
+        (self.data01 / 'override.yaml').write_text('added', encoding='utf-8')
+        assert path.joinpath('override.yaml').read_text(encoding='utf-8') == 'added'
+
     def test_repr(self):
         assert repr(MultiplexedPath(self.folder)) == f"MultiplexedPath('{self.folder}')"
 
     def test_name(self):
         assert MultiplexedPath(self.folder).name == os.path.basename(self.folder)
 
+    def test_slots(self):
+        assert not hasattr(MultiplexedPath(self.folder), '__dict__')
+
+    def test_as_file(self):
+        path = MultiplexedPath(self.folder, self.data01)
+        with as_file(path) as merged:
+            assert merged.name == 'namespacedata01'
+            assert merged.joinpath('__init__.py').is_file()
+            assert merged.joinpath('subdirectory', 'binary.file').is_file()
+            target = merged / 'binary.file'
+            assert target.is_symlink()
+            assert target.read_bytes() == (self.folder / 'binary.file').read_bytes()
+        assert not merged.exists()
+        assert (self.folder / 'binary.file').exists()
+
+    def test_as_file_select(self):
+        path = MultiplexedPath(self.folder, self.data01)
+        with as_file(path, select='*.file') as merged:
+            assert not merged.joinpath('__init__.py').exists()
+            assert not merged.joinpath('subdirectory').is_symlink()
+            assert merged.joinpath('subdirectory', 'binary.file').is_symlink()
+
+    def test_as_file_hardlinks(self):
+        path = MultiplexedPath(self.folder, self.data01)
+        with (
+            mock.patch.object(pathlib.Path, 'symlink_to', side_effect=OSError),
+            as_file(path) as merged,
+        ):
+            target = merged / '__init__.py'
+            assert not target.is_symlink()
+            assert target.samefile(self.data01 / '__init__.py')
+
+    def test_as_file_copies(self):
+        path = MultiplexedPath(self.folder, self.data01)
+        with (
+            mock.patch.object(pathlib.Path, 'symlink_to', side_effect=OSError),
+            mock.patch.object(pathlib.Path, 'hardlink_to', side_effect=OSError),
+            as_file(path) as merged,
+        ):
+            target = merged / 'utf-8.file'
+            source = self.folder / 'utf-8.file'
+            assert not target.samefile(source)
+            assert target.read_bytes() == source.read_bytes()
+
 
 class NamespaceReaderTest(util.DiskSetup, unittest.TestCase):
     MODULE = 'namespacedata01'
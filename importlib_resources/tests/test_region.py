@@ -0,0 +1,75 @@
+import os
+import unittest
+
+from importlib_resources import file_region, files, read_into, read_range
+
+from . import util
+
+
+class RegionTests:
+    def test_region(self):
+        resource = files(self.data) / 'subdirectory' / 'binary.file'
+        with file_region(resource) as region:
+            data = os.pread(region.fd, region.length, region.offset)
+        assert data == resource.read_bytes()
+        assert region.fd == -1
+
+    def test_directory(self):
+        assert file_region(files(self.data) / 'subdirectory') is None
+
+    def test_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            file_region(files(self.data) / 'missing.file')
+        with self.assertRaises(FileNotFoundError):
+            read_range(files(self.data) / 'missing.file', 0, 1)
+
+
+class RangeTests:
+    def test_range(self):
+        resource = files(self.data) / 'utf-8.file'
+        data = resource.read_bytes()
+        assert read_range(resource, 5, 10) == data[5:15]
+        assert read_range(resource, len(data) - 3, 10) == data[-3:]
+        assert read_range(resource, len(data) + 3, 10) == b''
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            read_range(files(self.data) / 'utf-8.file', -1, 10)
+
+
+class IntoTests:
+    def test_into(self):
+        resource = files(self.data) / 'subdirectory' / 'binary.file'
+        data = resource.read_bytes()
+        buffer = bytearray(len(data) + 10)
+        assert read_into(resource, buffer) == len(data)
+        assert buffer[: len(data)] == data
+        assert read_into(resource, memoryview(buffer)[: len(data)]) == len(data)
+
+    def test_too_small(self):
+        resource = files(self.data) / 'utf-8.file'
+        with self.assertRaises(ValueError):
+            read_into(resource, bytearray(3))
+
+
+@unittest.skipUnless(hasattr(os, 'pread'), 'requires os.pread')
+class RegionDiskTests(
+    RegionTests, RangeTests, IntoTests, util.DiskSetup, unittest.TestCase
+):
+    pass
+
+
+@unittest.skipUnless(hasattr(os, 'pread'), 'requires os.pread')
+class RegionZipTests(
+    RegionTests, RangeTests, IntoTests, util.ZipSetup, unittest.TestCase
+):
+    pass
+
+
+class RegionMemoryTests(RangeTests, IntoTests, util.MemorySetup, unittest.TestCase):
+    def test_none(self):
+        assert file_region(files(self.data) / 'binary.file') is None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -114,6 +114,18 @@ class ResourceFromZipsTest01(util.ZipSetup, unittest.TestCase):
             assert len(list(data.iterdir()))
         assert not data.parent.exists()
 
+    def test_as_file_select(self):
+        data = resources.files('data01')
+        with resources.as_file(data, select='subdirectory/*') as selected:
+            assert selected.joinpath('subdirectory', 'binary.file').is_file()
+            assert names(selected) == {'subdirectory'}
+
+    def test_as_file_select_predicate(self):
+        data = resources.files('data01')
+        with resources.as_file(data, select=lambda name: 'utf' in name) as selected:
+            assert names(selected) == {'subdirectory', 'utf-8.file', 'utf-16.file'}
+            assert not list(selected.joinpath('subdirectory').iterdir())
+
 
 class ResourceFromZipsTest02(util.ZipSetup, unittest.TestCase):
     MODULE = 'data02'
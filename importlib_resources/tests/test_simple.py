@@ -0,0 +1,147 @@
+import io
+import unittest
+
+from importlib_resources import simple
+from importlib_resources.abc import TraversalError
+
+store = {
+    'pkg': {
+        'a.txt': b'resource a',
+        'b.bin': bytes(range(8)),
+        'sub': {
+            'c.txt': b'resource c',
+            'deeper': {'d.txt': b'resource d'},
+        },
+    },
+}
+
+
+class BlobReader(simple.TraversableReader):
+    """
+    A SimpleReader for a blob store, counting round trips.
+    """
+
+    def __init__(self, package='pkg', calls=None):
+        self._package = package
+        self.calls = calls if calls is not None else []
+
+    @property
+    def package(self):
+        return self._package
+
+    def _node(self, path=None):
+        node = store
+        for part in (path or self.package).split('.'):
+            node = node[part]
+        return node
+
+    def children(self):
+        self.calls.append('children')
+        return [
+            BlobReader(f'{self.package}.{name}', self.calls)
+            for name, entry in self._node().items()
+            if isinstance(entry, dict)
+        ]
+
+    @property
+    def resources(self):
+        self.calls.append('resources')
+        return [
+            name for name, entry in self._node().items() if isinstance(entry, bytes)
+        ]
+
+    def open_binary(self, resource):
+        self.calls.append('open_binary')
+        *dirs, name = resource.split('/')
+        return io.BytesIO(self._node('.'.join([self.package, *dirs]))[name])
+
+
+class TreeBlobReader(BlobReader):
+    def tree(self):
+        self.calls.append('tree')
+        return self._listing(self._node())
+
+    @classmethod
+    def _listing(cls, node):
+        return {
+            name: cls._listing(entry) if isinstance(entry, dict) else len(entry)
+            for name, entry in node.items()
+        }
+
+
+def walk(traversable, prefix=''):
+    for child in traversable.iterdir():
+        path = prefix + child.name
+        if child.is_dir():
+            yield from walk(child, path + '/')
+        else:
+            yield path, child.read_bytes()
+
+
+class TraversableReaderTests:
+    def test_walk(self):
+        assert dict(walk(self.reader.files())) == {
+            'a.txt': b'resource a',
+            'b.bin': bytes(range(8)),
+            'sub/c.txt': b'resource c',
+            'sub/deeper/d.txt': b'resource d',
+        }
+
+    def test_name(self):
+        files = self.reader.files()
+        assert files.name == 'pkg'
+        assert files.joinpath('sub').name == 'sub'
+
+    def test_joinpath(self):
+        target = self.reader.files().joinpath('sub/deeper/d.txt')
+        assert target.read_text(encoding='utf-8') == 'resource d'
+
+    def test_open_directory(self):
+        with self.assertRaises(IsADirectoryError):
+            self.reader.files().open()
+
+    def test_slots(self):
+        files = self.reader.files()
+        for path in (files, *files.iterdir(), files.joinpath('sub/deeper/d.txt')):
+            assert not hasattr(path, '__dict__')
+
+
+class PerDirectoryTests(TraversableReaderTests, unittest.TestCase):
+    def setUp(self):
+        self.reader = BlobReader()
+
+    def test_round_trips(self):
+        dict(walk(self.reader.files()))
+        assert self.reader.calls.count('resources') == 3
+
+
+class TreeTests(TraversableReaderTests, unittest.TestCase):
+    def setUp(self):
+        self.reader = TreeBlobReader()
+
+    def test_round_trips(self):
+        dict(walk(self.reader.files()))
+        dict(walk(self.reader.files()))
+        assert self.reader.calls.count('tree') == 1
+        assert 'resources' not in self.reader.calls
+        assert 'children' not in self.reader.calls
+
+    def test_sizes(self):
+        sizes = {
+            child.name: child.size
+            for child in self.reader.files().iterdir()
+            if child.is_file()
+        }
+        assert sizes == {'a.txt': 10, 'b.bin': 8}
+
+    def test_joinpath_missing(self):
+        files = self.reader.files()
+        with self.assertRaises(TraversalError):
+            files.joinpath('sub/missing.txt')
+        with self.assertRaises(RuntimeError):
+            files.joinpath('a.txt/beyond')
+        assert files.joinpath('sub', 'deeper').joinpath('d.txt').size == 10
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import io
+import unittest
+import warnings
+
+from importlib_resources import _text
+
+
+def wrapped(data, encoding=None, errors=None):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', EncodingWarning)
+        return io.TextIOWrapper(io.BytesIO(data), encoding, errors).read()
+
+
+class DecodeTests(unittest.TestCase):
+    samples = (
+        b'',
+        b'plain',
+        b'a\r\nb\rc\nd\r',
+        b'\r\r\n\n\r',
+        'caf\xe9 ☃\r\n'.encode(),
+        b'\xff\xfe bad \r\n bytes \x80',
+    )
+    encodings = ('utf-8', 'utf-16', 'utf-16-le', 'utf-8-sig', 'latin-1', None, 'locale')
+
+    def test_matches_text_wrapper(self):
+        for sample in self.samples:
+            for encoding in self.encodings:
+                for errors in ('replace', 'surrogateescape'):
+                    with self.subTest(sample=sample, encoding=encoding, errors=errors):
+                        data = sample
+                        if encoding and encoding.startswith('utf-16'):
+                            data = sample.decode('latin-1').encode(encoding)
+                        with warnings.catch_warnings():
+                            warnings.simplefilter('ignore', EncodingWarning)
+                            actual = _text.decode(data, encoding, errors)
+                        assert actual == wrapped(data, encoding, errors)
+
+    def test_strict(self):
+        with self.assertRaises(UnicodeDecodeError):
+            _text.decode(b'\x80', 'utf-8')
+
+    def test_not_text_encoding(self):
+        with self.assertRaises(LookupError):
+            _text.decode(b'abc', 'rot13')
+
+
+if __name__ == '__main__':
+    unittest.main()
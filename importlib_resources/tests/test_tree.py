@@ -0,0 +1,54 @@
+import unittest
+
+from importlib_resources import _tree
+
+
+class TreeTests(unittest.TestCase):
+    def setUp(self):
+        entries = ['b/c/d.txt', 'a.txt', 'b/', 'b/e.txt', 'b/e.txt', 'ü/f.txt']
+        self.tree = _tree.Tree((name, len(name)) for name in entries)
+
+    def listing(self, path):
+        tree = self.tree
+        return [tree.path(node) for node in tree.children(tree.find(path))]
+
+    def test_implied_dirs(self):
+        assert self.listing('') == ['a.txt', 'b/', 'ü/']
+        assert self.listing('b') == ['b/c/', 'b/e.txt']
+        assert self.listing('b/c/') == ['b/c/d.txt']
+
+    def test_find(self):
+        tree = self.tree
+        assert tree.is_dir(tree.find('b/c/'))
+        assert tree.find('b/c/d.txt') > 0
+        assert tree.find('b/missing') == -1
+        assert tree.find('a.txt/d.txt') == -1
+        assert tree.find('') == 0
+        assert tree.child(tree.find('b'), 'c') == tree.find('b/c')
+        assert tree.child(0, 'c') == -1
+
+    def test_nodes(self):
+        tree = self.tree
+        assert len(tree) == 8
+        paths = [tree.path(node) for node in range(len(tree))]
+        assert paths == [
+            '',
+            'a.txt',
+            'b/',
+            'ü/',
+            'b/c/',
+            'b/e.txt',
+            'ü/f.txt',
+            'b/c/d.txt',
+        ]
+        assert all(tree.find(path) == node for node, path in enumerate(paths))
+        node = tree.find('ü/f.txt')
+        assert tree.name(node) == 'f.txt'
+        assert tree.sizes[node] == len('ü/f.txt')
+        assert not tree.is_dir(node)
+        assert tree.is_dir(tree.find('ü'))
+        assert list(tree.children(node)) == []
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,451 @@
+import concurrent.futures
+import contextlib
+import io
+import os
+import pathlib
+import random
+import types
+import unittest
+import zipfile
+from unittest import mock
+
+from importlib_resources import (
+    _extract,
+    _zip,
+    as_file,
+    file_region,
+    read_into,
+    read_range,
+)
+from importlib_resources.readers import NamespaceReader, ZipReader
+
+from .compat.py39 import os_helper
+
+
+def sample(size):
+    """
+    Generate compressible, non-repeating data.
+    """
+    rand = random.Random(size)
+    words = [bytes(rand.choices(b'abcdefgh', k=rand.randint(2, 9))) for _ in range(64)]
+    data = b' '.join(rand.choice(words) for _ in range(size // 3))
+    return data[:size]
+
+
+class ZipFixture:
+    members = types.MappingProxyType({
+        'big.bin': sample(10_000),
+        'stored.bin': sample(3_000),
+        'small.txt': b'small resource',
+    })
+
+    def setUp(self):
+        self.fixtures = contextlib.ExitStack()
+        self.addCleanup(self.fixtures.close)
+        temp_dir = pathlib.Path(self.fixtures.enter_context(os_helper.temp_dir()))
+        self.archive = temp_dir / 'archive.zip'
+        with zipfile.ZipFile(self.archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, data in self.members.items():
+                compression = zipfile.ZIP_STORED if 'stored' in name else None
+                zf.writestr(name, data, compress_type=compression)
+        self.fixtures.enter_context(
+            mock.patch.object(_zip, 'CHECKPOINT_INTERVAL', 1024)
+        )
+
+    def path(self, name=''):
+        return _zip.Path(_zip.Archive.for_path(self.archive), name)
+
+    def open(self, name):
+        return self.path(name).open('rb')
+
+
+class DeflatedMemberTests(ZipFixture, unittest.TestCase):
+    def test_read_through(self):
+        with self.open('big.bin') as strm:
+            assert isinstance(strm.raw, _zip.DeflatedMember)
+            assert strm.read() == self.members['big.bin']
+
+    def test_random_access(self):
+        data = self.members['big.bin']
+        offsets = random.Random(0).choices(range(len(data)), k=50)
+        with self.open('big.bin') as strm:
+            for offset in offsets:
+                strm.seek(offset)
+                assert strm.read(100) == data[offset : offset + 100]
+                assert strm.tell() == min(offset + 100, len(data))
+
+    def test_seek_whence(self):
+        data = self.members['big.bin']
+        with self.open('big.bin') as strm:
+            strm.seek(-10, io.SEEK_END)
+            assert strm.read() == data[-10:]
+            strm.seek(5000)
+            strm.seek(-2000, io.SEEK_CUR)
+            assert strm.read(10) == data[3000:3010]
+            strm.seek(len(data) + 10)
+            assert strm.read() == b''
+
+    def test_checkpoints_shared(self):
+        data = self.members['big.bin']
+        with self.open('big.bin') as strm:
+            strm.seek(1)
+            strm.read()
+        with self.open('big.bin') as strm:
+            assert len(strm.raw._checkpoints.offsets) == len(data) // 1024 + 1
+            strm.seek(9000)
+            assert strm.read(10) == data[9000:9010]
+
+    def test_read_through_records_nothing(self):
+        with self.open('big.bin') as strm:
+            strm.read()
+            assert strm.raw._checkpoints.offsets == [0]
+
+    def test_checkpoints_bounded(self):
+        archive = _zip.Archive.for_path(self.archive)
+        with mock.patch.object(_zip, 'CHECKPOINTED_MEMBERS', 1):
+            first = archive.checkpoints(archive.zipfile.getinfo('big.bin'), 1024)
+            archive.checkpoints(archive.zipfile.getinfo('small.txt'), 1024)
+            assert list(archive._checkpoints) == [('small.txt', 1024)]
+            assert first is not archive.checkpoints(
+                archive.zipfile.getinfo('big.bin'), 1024
+            )
+
+    def test_concurrent_checkpoints(self):
+        """
+        Streams racing to record checkpoints agree on the data.
+        """
+        data = self.members['big.bin']
+
+        def read_at(offset):
+            with self.open('big.bin') as strm:
+                strm.seek(offset)
+                return strm.read(50)
+
+        offsets = random.Random(1).choices(range(len(data)), k=200)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(read_at, offsets))
+        assert results == [data[offset : offset + 50] for offset in offsets]
+
+    def test_bad_crc(self):
+        archive = _zip.Archive.for_path(self.archive)
+        info = archive.zipfile.getinfo('big.bin')
+        info.CRC ^= 1
+        strm = io.BufferedReader(_zip.DeflatedMember(archive, info))
+        with strm, self.assertRaises(zipfile.BadZipFile):
+            strm.read()
+
+    def test_short_member(self):
+        """
+        A member ending before its recorded size reads short rather
+        than seeking forever.
+        """
+        data = self.members['big.bin']
+        archive = _zip.Archive.for_path(self.archive)
+        info = archive.zipfile.getinfo('big.bin')
+        info.file_size += 100
+        with io.BufferedReader(_zip.DeflatedMember(archive, info)) as strm:
+            strm.seek(len(data) + 50)
+            assert strm.read() == b''
+            strm.seek(len(data) - 10)
+            assert strm.read() == data[-10:]
+
+    def test_no_region(self):
+        assert file_region(self.path('big.bin')) is None
+
+    def test_read_range(self):
+        data = self.members['big.bin']
+        assert read_range(self.path('big.bin'), 7000, 100) == data[7000:7100]
+
+    def test_read_into(self):
+        for name, data in self.members.items():
+            buffer = bytearray(len(data))
+            assert read_into(self.path(name), buffer) == len(data)
+            assert buffer == data
+            with self.assertRaises(ValueError):
+                read_into(self.path(name), bytearray(len(data) - 1))
+
+
+class StoredMemberTests(ZipFixture, unittest.TestCase):
+    def test_read(self):
+        data = self.members['stored.bin']
+        with self.open('stored.bin') as strm:
+            assert isinstance(strm.raw, _zip.StoredMember)
+            assert strm.read() == data
+            strm.seek(1234)
+            assert strm.read(10) == data[1234:1244]
+
+
+class PathTests(ZipFixture, unittest.TestCase):
+    def test_traverse(self):
+        root = self.path()
+        assert {child.name for child in root.iterdir()} == set(self.members)
+        assert all(isinstance(child, _zip.Path) for child in root.iterdir())
+        assert (root / 'small.txt').read_bytes() == b'small resource'
+
+    def test_read_text(self):
+        text = self.path('small.txt').read_text(encoding='utf-8')
+        assert text == 'small resource'
+
+    def test_read_text_newlines(self):
+        with zipfile.ZipFile(self.archive, 'a') as zf:
+            zf.writestr('crlf.txt', b'one\r\ntwo\r')
+        path = self.path('crlf.txt')
+        assert path.read_text(encoding='utf-8') == 'one\ntwo\n'
+        assert path.read_text('utf-8', None, '') == 'one\r\ntwo\r'
+        assert path.read_text(encoding='utf-8', newline='') == 'one\r\ntwo\r'
+
+    def test_binary_encoding(self):
+        with self.assertRaises(ValueError):
+            self.path('small.txt').open('rb', encoding='utf-8')
+
+    def test_archive_shared(self):
+        assert self.path().archive is self.path().archive
+
+    def test_archive_replaced(self):
+        first = self.path().archive
+        with zipfile.ZipFile(self.archive, 'a') as zf:
+            zf.writestr('new.txt', b'new resource')
+        assert self.path().archive is not first
+        assert self.path('new.txt').read_bytes() == b'new resource'
+
+    def test_concurrent_reads(self):
+        names = list(self.members) * 20
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = executor.map(lambda name: self.path(name).read_bytes(), names)
+            assert list(results) == [self.members[name] for name in names]
+
+
+class IndexTests(unittest.TestCase):
+    def test_implied_dirs(self):
+        index = _zip.Index(['a.txt', 'b/c/d.txt', 'b/', 'b/e.txt', 'b/e.txt'])
+        assert index.children[''] == ['a.txt', 'b/']
+        assert index.children['b/'] == ['b/c/', 'b/e.txt']
+        assert index.children['b/c/'] == ['b/c/d.txt']
+        assert 'b/c/' in index
+        assert 'b/c/d.txt' in index
+        assert 'b/c' not in index
+        assert '' not in index
+
+
+class IndexedPathTests(ZipFixture, unittest.TestCase):
+    members = types.MappingProxyType({
+        **ZipFixture.members,
+        'sub/dir/deep.txt': b'deep',
+    })
+
+    def test_iterdir(self):
+        assert [child.at for child in self.path('sub/').iterdir()] == ['sub/dir/']
+        with self.assertRaises(ValueError):
+            self.path('small.txt').iterdir()
+
+    def test_joinpath(self):
+        root = self.path()
+        assert root.joinpath('sub', 'dir').at == 'sub/dir/'
+        assert root.joinpath('sub/dir/deep.txt').is_file()
+        assert (root / 'sub').is_dir()
+        assert (root / 'sub').exists()
+        assert not (root / 'sub').is_file()
+
+    def test_missing(self):
+        missing = self.path() / 'sub' / 'missing.txt'
+        assert not missing.exists()
+        assert not missing.is_file()
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+class ForkTests(ZipFixture, unittest.TestCase):
+    def test_child_keeps_file(self):
+        root = self.path()
+        replacement = self.archive.with_name('replacement.zip')
+        with zipfile.ZipFile(replacement, 'w') as zf:
+            zf.writestr('small.txt', b'Z' * 100)
+        os.replace(replacement, self.archive)
+        pid = os.fork()
+        if not pid:  # pragma: no cover
+            ok = (
+                (root / 'small.txt').read_bytes() == self.members['small.txt']
+                and read_range(root / 'small.txt', 0, 5) == b'small'
+                and root.archive.zipfile.read('big.bin') == self.members['big.bin']
+            )
+            os._exit(not ok)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert (root / 'small.txt').read_bytes() == self.members['small.txt']
+
+    def test_zipfile_reads(self):
+        """
+        Members read by ``zipfile`` in parent and child at once
+        don't disturb each other.
+        """
+        data = random.Random(0).randbytes(100_000)
+        with zipfile.ZipFile(self.archive, 'a', zipfile.ZIP_LZMA) as zf:
+            zf.writestr('packed.bin', data)
+        packed = self.path('packed.bin')
+
+        def reads_ok():
+            with contextlib.suppress(Exception):
+                return all(packed.read_bytes() == data for _ in range(60))
+            return False
+
+        pid = os.fork()
+        if not pid:  # pragma: no cover
+            os._exit(not reads_ok())
+        ok = reads_ok()
+        _, status = os.waitpid(pid, 0)
+        assert ok
+        assert os.waitstatus_to_exitcode(status) == 0
+
+
+@unittest.skipUnless(_extract.fcntl, 'requires fcntl')
+class ExtractionCacheTests(ZipFixture, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = pathlib.Path(self.fixtures.enter_context(os_helper.temp_dir()))
+        environ = {'IMPORTLIB_RESOURCES_CACHE': str(self.cache)}
+        self.fixtures.enter_context(mock.patch.dict(os.environ, environ))
+
+    def extract(self, name):
+        with as_file(self.path(name)) as path:
+            return path
+
+    def test_reused(self):
+        path = self.extract('big.bin')
+        assert path.read_bytes() == self.members['big.bin']
+        assert path.name == 'big.bin'
+        assert path.is_relative_to(self.cache)
+        inode = path.stat().st_ino
+        assert self.extract('big.bin') == path
+        assert path.stat().st_ino == inode
+
+    def test_changed(self):
+        first = self.extract('small.txt')
+        with zipfile.ZipFile(self.archive, 'w') as zf:
+            zf.writestr('small.txt', b'changed resource')
+        path = self.extract('small.txt')
+        assert path != first
+        assert path.read_bytes() == b'changed resource'
+
+    def test_permissions(self):
+        info = zipfile.ZipInfo('tool.sh')
+        info.external_attr = 0o755 << 16
+        with zipfile.ZipFile(self.archive, 'a') as zf:
+            zf.writestr(info, b'#!/bin/sh\n')
+        assert os.access(self.extract('tool.sh'), os.X_OK)
+
+    def test_evicted(self):
+        os.environ['IMPORTLIB_RESOURCES_CACHE_SIZE'] = '5000'
+        big = self.extract('big.bin')
+        with as_file(self.path('stored.bin')) as stored:
+            assert not big.exists()
+            self.extract('small.txt')
+            assert stored.exists()
+        assert self.extract('big.bin').read_bytes() == self.members['big.bin']
+
+    def test_broken(self):
+        path = self.extract('small.txt')
+        (path.parent / '.lock').unlink()
+        path.unlink()
+        assert self.extract('small.txt').read_bytes() == self.members['small.txt']
+        assert not list(self.cache.rglob('.trash-*'))
+
+    def test_concurrent(self):
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            paths = set(executor.map(self.extract, ['stored.bin'] * 20))
+        (path,) = paths
+        assert path.read_bytes() == self.members['stored.bin']
+        assert not list(self.cache.rglob('.tmp-*'))
+
+    def test_directory(self):
+        with as_file(self.path()) as path:
+            assert not path.is_relative_to(self.cache)
+            assert (path / 'small.txt').read_bytes() == b'small resource'
+
+
+class NestedArchiveTests(ZipFixture, unittest.TestCase):
+    members = types.MappingProxyType({
+        **ZipFixture.members,
+        'pkg/data.txt': b'nested data',
+    })
+
+    def setUp(self):
+        super().setUp()
+        self.outer = self.archive.with_name('app.pyz')
+        inner = self.archive.read_bytes()
+        with zipfile.ZipFile(self.outer, 'w') as zf:
+            zf.writestr('plugins/stored.zip', inner)
+            zf.writestr('plugins/deflated.zip', inner, zipfile.ZIP_DEFLATED)
+            with zipfile.ZipFile(buffer := io.BytesIO(), 'w') as middle:
+                middle.writestr('inner.zip', inner)
+            zf.writestr('plugins/middle.zip', buffer.getvalue())
+
+    def nested(self, *names):
+        return _zip.Archive.for_path(os.path.join(self.outer, 'plugins', *names))
+
+    def check(self, archive):
+        root = _zip.Path(archive)
+        for name, data in self.members.items():
+            assert root.joinpath(name).read_bytes() == data
+        assert read_range(root / 'big.bin', 100, 10) == self.members['big.bin'][100:110]
+
+    def test_stored(self):
+        archive = self.nested('stored.zip')
+        assert isinstance(archive, _zip.NestedArchive)
+        self.check(archive)
+        with file_region(_zip.Path(archive, 'stored.bin')) as region:
+            data = os.pread(region.fd, region.length, region.offset)
+        assert data == self.members['stored.bin']
+
+    def test_deflated(self):
+        archive = self.nested('deflated.zip')
+        self.check(archive)
+        assert file_region(_zip.Path(archive, 'stored.bin')) is None
+
+    def test_doubly_nested(self):
+        archive = self.nested('middle.zip', 'inner.zip')
+        assert archive.outer.outer is _zip.Archive.for_path(self.outer)
+        self.check(archive)
+
+    def test_shared(self):
+        assert self.nested('stored.zip') is self.nested('stored.zip')
+
+    def test_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            self.nested('missing.zip')
+        with self.assertRaises(FileNotFoundError):
+            self.nested('stored.zip', 'pkg')
+
+    def test_namespace_portion(self):
+        portion = os.path.join(self.outer, 'plugins', 'stored.zip', 'pkg')
+        path = NamespaceReader._resolve(portion)
+        assert path.joinpath('data.txt').read_bytes() == b'nested data'
+
+    def test_zip_reader(self):
+        loader = types.SimpleNamespace(
+            prefix='pkg/',
+            archive=os.path.join(self.outer, 'plugins', 'deflated.zip'),
+            is_package=lambda name: False,
+        )
+        files = ZipReader(loader, 'pkg.mod').files()
+        assert files.joinpath('data.txt').read_bytes() == b'nested data'
+
+
+class ZipReaderOpenTests(ZipFixture, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        loader = types.SimpleNamespace(
+            prefix='', archive=str(self.archive), is_package=lambda name: False
+        )
+        self.reader = ZipReader(loader, 'mod')
+
+    def test_open_resource(self):
+        with self.reader.open_resource('big.bin') as strm:
+            strm.seek(4321)
+            assert strm.read(5) == self.members['big.bin'][4321:4326]
+
+    def test_open_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            self.reader.open_resource('missing.bin')
+
+
+if __name__ == '__main__':
+    unittest.main()